@@ -0,0 +1,86 @@
+"""Shared helpers for the scripts in this directory."""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Tuple
+import sys
+
+
+@lru_cache(maxsize=None)
+def public_members(cls: type) -> Tuple[str, ...]:
+    """List the public attribute names of a class.
+
+    Cached per class, so repeated introspection doesn't re-walk the MRO.
+
+    Args:
+        cls: Class to inspect
+
+    Returns:
+        Sorted tuple of attribute names not starting with an underscore
+    """
+    return tuple(m for m in dir(cls) if not m.startswith('_'))
+
+
+# Content extractor per message class, resolved the first time a class is seen
+_EXTRACTORS = {
+    dict: lambda m: m.get('content') or m.get('text'),
+}
+
+
+def _resolve_extractor(msg):
+    """Pick how to read text from messages of the same class as msg."""
+    for attr in ('content', 'text'):
+        if hasattr(msg, attr):
+            return attrgetter(attr)
+    return lambda m: None
+
+
+def _part_text(part) -> str:
+    """Text of one content part (object or dict); '' for non-text parts."""
+    if isinstance(part, str):
+        return part
+    if isinstance(part, dict):
+        return part.get('text') or ''
+    return getattr(part, 'text', None) or ''
+
+
+def message_content(msg) -> Optional[str]:
+    """Extract the text content of a Letta message (object or dict).
+
+    Multi-part content (a list of content parts) is joined into one string.
+    """
+    cls = type(msg)
+    extractor = _EXTRACTORS.get(cls)
+    if extractor is None:
+        extractor = _EXTRACTORS[cls] = _resolve_extractor(msg)
+    content = extractor(msg)
+    if isinstance(content, (list, tuple)):
+        return ''.join(_part_text(part) for part in content)
+    return content
+
+
+def print_streamed_reply(client, agent_id: str, message: str, prefix: str = "Rumi: ") -> bool:
+    """Send a message to an agent and print the reply as it streams in.
+
+    Args:
+        client: RumiLettaClient
+        agent_id: Agent ID
+        message: Message text
+        prefix: Written once, before the first piece of content
+
+    Returns:
+        True if any content was printed (the line is then terminated)
+    """
+    started = False
+    for msg in client.stream_message(agent_id, message):
+        content = message_content(msg)
+        if content:
+            if not started:
+                sys.stdout.write(prefix)
+                started = True
+            sys.stdout.write(content)
+            sys.stdout.flush()
+
+    if started:
+        print("")
+    return started
@@ -7,7 +7,8 @@ to all your blog posts and remembers everything across sessions.
 Run with: PYTHONPATH=/Users/agamjain/Downloads/rumi venv/bin/python scripts/chat_with_rumi.py
 """
 
-from src.agents.letta_client import RumiLettaClient
+from scripts._common import print_streamed_reply
+from src.agents.letta_client import RumiLettaClient, get_default_client
 import logging
 import sys
 
@@ -67,7 +68,7 @@ def chat():
     # Initialize client
     try:
         print("Connecting to Rumi...")
-        client = RumiLettaClient()
+        client = get_default_client()
     except Exception as e:
         print(f"✗ Failed to connect to Letta server: {e}")
         print("\nMake sure Letta server is running:")
@@ -76,13 +77,7 @@ def chat():
 
     # Find Rumi agent
     try:
-        agents = client.list_agents()
-        rumi_agent = None
-
-        for agent in agents:
-            if agent.name == "rumi":
-                rumi_agent = agent
-                break
+        rumi_agent = client.get_agent_by_name("rumi")
 
         if not rumi_agent:
             print("✗ Rumi agent not found!")
@@ -123,25 +118,10 @@ def chat():
                 print_memory(client, agent_id)
                 continue
 
-            # Send message to Rumi
+            # Send message to Rumi, printing the reply as it streams in
             try:
-                response = client.send_message(agent_id, user_input)
-
-                # Print Rumi's response
                 print("")
-                for msg in response:
-                    # Handle different message formats
-                    content = None
-                    if hasattr(msg, 'content'):
-                        content = msg.content
-                    elif hasattr(msg, 'text'):
-                        content = msg.text
-                    elif isinstance(msg, dict):
-                        content = msg.get('content') or msg.get('text')
-
-                    if content:
-                        print(f"Rumi: {content}")
-
+                print_streamed_reply(client, agent_id, user_input)
                 print("")
 
             except Exception as e:
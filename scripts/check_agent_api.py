@@ -1,17 +1,24 @@
 """Check agent API methods."""
 
-from src.agents.letta_client import RumiLettaClient
+from src.agents.letta_client import get_default_client
+from scripts._common import public_members
 
-client = RumiLettaClient()
 
-print("Agent client methods:")
-print([m for m in dir(client.client.agents) if not m.startswith('_')])
-print("")
+def main():
+    """Entry point."""
+    client = get_default_client()
 
-# Get Rumi agent
-agents = client.list_agents()
-rumi = next((a for a in agents if a.name == "rumi"), None)
+    print("Agent client methods:")
+    print(list(public_members(type(client.client.agents))))
+    print("")
 
-if rumi:
-    print(f"Rumi agent attributes:")
-    print([attr for attr in dir(rumi) if not attr.startswith('_')])
+    # Get Rumi agent
+    rumi = client.get_agent_by_name("rumi")
+
+    if rumi:
+        print(f"Rumi agent attributes:")
+        print(list(public_members(type(rumi))))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 """Check tools API on agent."""
 
-from src.agents.letta_client import RumiLettaClient
+from src.agents.letta_client import get_default_client
+from scripts._common import public_members
 
-client = RumiLettaClient()
 
-print("agents.tools methods:")
-print([m for m in dir(client.client.agents.tools) if not m.startswith('_')])
+def main():
+    """Entry point."""
+    client = get_default_client()
+
+    print("agents.tools methods:")
+    print(list(public_members(type(client.client.agents.tools))))
+
+
+if __name__ == "__main__":
+    main()
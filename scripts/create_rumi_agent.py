@@ -10,13 +10,71 @@ This script sets up the main Rumi agent that can:
 Run with: PYTHONPATH=/Users/agamjain/Downloads/rumi venv/bin/python scripts/create_rumi_agent.py
 """
 
-from src.agents.letta_client import RumiLettaClient
+from src.agents.letta_client import get_default_client
 from src.config.settings import settings
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Memory block contents. Module-level so they're built once and can be
+# reused by other scripts (e.g. from scripts.create_rumi_agent import PERSONA_BLOCK).
+PERSONA_BLOCK = """\
+You are Rumi, Agam's personal AI assistant.
+
+Your purpose:
+- Help Agam remember and organize their work and thoughts
+- Search and retrieve content from their blog posts
+- Maintain context across conversations
+- Learn and adapt based on their preferences
+
+Your capabilities:
+- Access to all of Agam's blog posts (search_blog_posts tool)
+- Semantic search to find relevant content
+- Memory that persists across sessions
+- Ability to update your understanding over time
+
+Your communication style:
+- Direct and concise (like Agam prefers)
+- Technical and accurate
+- No emojis unless explicitly requested
+- No unnecessary pleasantries or fluff
+- Focus on substance over form
+
+When answering questions:
+1. If it's about Agam's blog content, use search_blog_posts
+2. Provide specific references (post titles, dates)
+3. Include relevant URLs for deeper reading
+4. Be accurate - if you don't know, say so
+
+Remember:
+- You're not just a chatbot, you're a memory system
+- Update your knowledge when Agam provides new information
+- Your job is to make Agam's life easier, not impress them"""
+
+HUMAN_BLOCK = """\
+Name: Agam Jain
+Role: Founder of Tensorfuse
+Location: Working on ML infrastructure
+
+Interests:
+- ML infrastructure (vLLM, RAG, rerankers)
+- Building products (Tensorfuse, Fastpull)
+- Philosophy (Advaita, consciousness, detachment)
+- Personal growth and mental health
+
+Communication style:
+- Prefers direct, concise communication
+- No unnecessary fluff or emojis
+- Values technical accuracy
+- Appreciates learning from first principles"""
+
+HUMAN_FOCUS_BLOCK = """\
+Current focus:
+- Building Rumi (this AI assistant)
+- Understanding agent memory systems
+- Organizing personal content (blog posts, transcripts)"""
+
 
 def create_rumi_agent(recreate: bool = False):
     """Create the Rumi agent with full configuration.
@@ -31,16 +89,10 @@ def create_rumi_agent(recreate: bool = False):
     logger.info("")
 
     # Initialize client
-    client = RumiLettaClient()
+    client = get_default_client()
 
     # Check if Rumi already exists
-    existing_agents = client.list_agents()
-    rumi_agent = None
-
-    for agent in existing_agents:
-        if agent.name == "rumi":
-            rumi_agent = agent
-            break
+    rumi_agent = client.get_agent_by_name("rumi")
 
     if rumi_agent:
         if recreate:
@@ -60,68 +112,13 @@ def create_rumi_agent(recreate: bool = False):
     # Define memory blocks
     logger.info("Configuring memory blocks...")
 
+    # Blocks are compiled into the context window in list order. Keep the
+    # static persona first and the frequently edited "current focus" last so
+    # memory edits don't break the provider's prompt-cache prefix.
     memory_blocks = [
-        {
-            "label": "human",
-            "value": (
-                "Name: Agam Jain\n"
-                "Role: Founder of Tensorfuse\n"
-                "Location: Working on ML infrastructure\n"
-                "\n"
-                "Interests:\n"
-                "- ML infrastructure (vLLM, RAG, rerankers)\n"
-                "- Building products (Tensorfuse, Fastpull)\n"
-                "- Philosophy (Advaita, consciousness, detachment)\n"
-                "- Personal growth and mental health\n"
-                "\n"
-                "Communication style:\n"
-                "- Prefers direct, concise communication\n"
-                "- No unnecessary fluff or emojis\n"
-                "- Values technical accuracy\n"
-                "- Appreciates learning from first principles\n"
-                "\n"
-                "Current focus:\n"
-                "- Building Rumi (this AI assistant)\n"
-                "- Understanding agent memory systems\n"
-                "- Organizing personal content (blog posts, transcripts)"
-            )
-        },
-        {
-            "label": "persona",
-            "value": (
-                "You are Rumi, Agam's personal AI assistant.\n"
-                "\n"
-                "Your purpose:\n"
-                "- Help Agam remember and organize their work and thoughts\n"
-                "- Search and retrieve content from their blog posts\n"
-                "- Maintain context across conversations\n"
-                "- Learn and adapt based on their preferences\n"
-                "\n"
-                "Your capabilities:\n"
-                "- Access to all of Agam's blog posts (search_blog_posts tool)\n"
-                "- Semantic search to find relevant content\n"
-                "- Memory that persists across sessions\n"
-                "- Ability to update your understanding over time\n"
-                "\n"
-                "Your communication style:\n"
-                "- Direct and concise (like Agam prefers)\n"
-                "- Technical and accurate\n"
-                "- No emojis unless explicitly requested\n"
-                "- No unnecessary pleasantries or fluff\n"
-                "- Focus on substance over form\n"
-                "\n"
-                "When answering questions:\n"
-                "1. If it's about Agam's blog content, use search_blog_posts\n"
-                "2. Provide specific references (post titles, dates)\n"
-                "3. Include relevant URLs for deeper reading\n"
-                "4. Be accurate - if you don't know, say so\n"
-                "\n"
-                "Remember:\n"
-                "- You're not just a chatbot, you're a memory system\n"
-                "- Update your knowledge when Agam provides new information\n"
-                "- Your job is to make Agam's life easier, not impress them"
-            )
-        }
+        {"label": "persona", "value": PERSONA_BLOCK},
+        {"label": "human", "value": HUMAN_BLOCK},
+        {"label": "human_focus", "value": HUMAN_FOCUS_BLOCK}
     ]
 
     logger.info("  ✓ Memory blocks configured")
@@ -157,8 +154,9 @@ def create_rumi_agent(recreate: bool = False):
     logger.info(f"LLM Provider: {settings.llm_provider}")
     logger.info("")
     logger.info("Memory Blocks:")
-    logger.info("  1. human - Information about Agam")
-    logger.info("  2. persona - Rumi's behavior and capabilities")
+    logger.info("  1. persona - Rumi's behavior and capabilities")
+    logger.info("  2. human - Stable facts about Agam")
+    logger.info("  3. human_focus - Agam's current focus (changes often)")
     logger.info("")
     logger.info("=" * 80)
     logger.info("AVAILABLE TOOLS")
@@ -1,59 +1,99 @@
 """Delete old tools and create new ones with correct source code."""
 
-from src.agents.letta_client import RumiLettaClient
+from src.agents.letta_client import get_default_client
+from concurrent.futures import ThreadPoolExecutor
 import inspect
-from src.agents import qdrant_tools
+from src.agents import qdrant_tools, tool_runtime
 
-client = RumiLettaClient()
-
-print("Recreating Qdrant tools...")
-
-# Get all tools
-all_tools = client.client.tools.list()
 blog_tool_names = ['search_blog_posts', 'list_recent_posts', 'get_blog_post_content']
 
-# Delete old tools
-print("\n1. Deleting old tools...")
-for tool in all_tools:
-    if tool.name in blog_tool_names:
-        try:
-            client.client.tools.delete(tool_id=tool.id)
-            print(f"   ✓ Deleted {tool.name}")
-        except Exception as e:
-            print(f"   ! Error deleting {tool.name}: {e}")
 
-# Create new tools with function source
-print("\n2. Creating new tools...")
+def delete_tool(client, tool):
+    """Delete a tool, returning the exception instead of raising."""
+    try:
+        client.client.tools.delete(tool_id=tool.id)
+        return None
+    except Exception as e:
+        return e
 
-from letta_client.types import PipRequirement
 
-for tool_name in blog_tool_names:
+def create_tool(client, payload, pip_requirements):
+    """Create a tool from a (name, source, description) payload."""
+    tool_name, source_code, description = payload
     try:
-        func = getattr(qdrant_tools, tool_name)
-        source_code = inspect.getsource(func)
-        description = func.__doc__.strip() if func.__doc__ else f"Tool: {tool_name}"
-
         # Create tool with source code and pip requirements
-        new_tool = client.client.tools.create(
+        return client.client.tools.create(
             source_code=source_code,
             description=description,
             source_type="python",
             tags=["blog", "qdrant"],
-            pip_requirements=[
-                PipRequirement(name="qdrant-client"),
-                PipRequirement(name="openai")
-            ]
+            pip_requirements=pip_requirements
         )
-        print(f"   ✓ Created {tool_name} (ID: {new_tool.id})")
     except Exception as e:
-        print(f"   ! Error creating {tool_name}: {e}")
+        return e
+
+
+def main():
+    """Entry point."""
+    from letta_client.types import PipRequirement
+
+    client = get_default_client()
+
+    print("Recreating Qdrant tools...")
+
+    # Look up existing blog tools by name
+    old_tools = client.get_tools_by_names(blog_tool_names)
+
+    # Delete old tools (independent requests, issued concurrently)
+    print("\n1. Deleting old tools...")
+    with ThreadPoolExecutor(max_workers=len(blog_tool_names)) as executor:
+        tools = list(old_tools.values())
+        errors = executor.map(lambda tool: delete_tool(client, tool), tools)
+        for tool, error in zip(tools, errors):
+            if error is None:
+                print(f"   ✓ Deleted {tool.name}")
+            else:
+                print(f"   ! Error deleting {tool.name}: {error}")
+
+    # Create new tools with function source
+    print("\n2. Creating new tools...")
+
+    # Build every payload up front so the creates below are pure network calls.
+    # Each tool ships with the shared runtime it calls into; the tool function
+    # must come last, since Letta treats the last function as the tool.
+    runtime_source = inspect.getsource(tool_runtime)
+    payloads = []
+    for tool_name in blog_tool_names:
+        func = getattr(qdrant_tools, tool_name)
+        description = func.__doc__.strip() if func.__doc__ else f"Tool: {tool_name}"
+        source_code = f"{runtime_source}\n\n{inspect.getsource(func)}"
+        payloads.append((tool_name, source_code, description))
+
+    pip_requirements = [
+        PipRequirement(name="qdrant-client"),
+        PipRequirement(name="openai")
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        results = executor.map(
+            lambda payload: create_tool(client, payload, pip_requirements),
+            payloads
+        )
+        for (tool_name, _, _), result in zip(payloads, results):
+            if isinstance(result, Exception):
+                print(f"   ! Error creating {tool_name}: {result}")
+            else:
+                print(f"   ✓ Created {tool_name} (ID: {result.id})")
+
+    print("\n✓ Done! New tools created.")
+
+    # List all tools to verify
+    print("\nAvailable blog tools:")
+    blog_tools = client.get_tools_by_names(blog_tool_names)
 
-print("\n✓ Done! New tools created.")
+    for tool in blog_tools.values():
+        print(f"  • {tool.name} (ID: {tool.id})")
 
-# List all tools to verify
-print("\nAvailable blog tools:")
-all_tools = client.client.tools.list()
-blog_tools = [t for t in all_tools if t.name in blog_tool_names]
 
-for tool in blog_tools:
-    print(f"  • {tool.name} (ID: {tool.id})")
+if __name__ == "__main__":
+    main()
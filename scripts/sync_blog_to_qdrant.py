@@ -12,12 +12,19 @@ This script demonstrates the complete ingestion workflow:
 Run with: PYTHONPATH=/Users/agamjain/Downloads/rumi venv/bin/python scripts/sync_blog_to_qdrant.py
 """
 
-from src.ingestion.blog import fetch_blog_posts
+from src.agents.tool_runtime import clear_result_cache
+from src.config.settings import settings
+from src.ingestion.blog import fetch_blog_posts, normalize_title, url_slug
 from src.processing.classifier import classify_content
 from src.storage.embeddings import EmbeddingGenerator
 from src.storage.qdrant_client import RumiQdrantClient
+from typing import Callable, Dict, List, Optional
 import logging
+import queue
 import sys
+import threading
+import time
+from contextlib import ExitStack
 from datetime import datetime
 
 logging.basicConfig(
@@ -26,6 +33,259 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Worker threads per pipeline stage, and capacity of the queues between
+# stages (bounded so a fast stage can't run arbitrarily far ahead)
+CLASSIFY_WORKERS = 4
+EMBED_WORKERS = 2
+UPSERT_WORKERS = 2  # Qdrant gains little from more than 2 concurrent upserts
+STAGE_QUEUE_SIZE = 32
+
+# Max posts whose chunks are embedded together (packed into requests of
+# up to 96 inputs by EmbeddingGenerator.embed_documents)
+EMBED_BATCH_POSTS = 16
+
+# Max posts stored together, and points per Qdrant upsert request
+UPSERT_BATCH_POSTS = 16
+UPSERT_BATCH_SIZE = 64
+
+_DONE = object()  # Sentinel telling a stage worker to exit
+
+
+def blog_doc_id(post: Dict) -> str:
+    """Build the document ID for a blog post from its URL slug."""
+    return f"blog:{url_slug(post['url'])}"
+
+
+def classify_stage(job: Dict) -> bool:
+    """Classify a post and skip it if it is already stored.
+
+    Args:
+        job: Pipeline job with 'prefix', 'post', 'doc_id', 'full_text',
+            'token_count' and 'exists'
+
+    Returns:
+        True if the post still needs embedding, False if it was skipped
+    """
+    post = job['post']
+    prefix = job['prefix']
+    logger.info(
+        "%s Processing: %s (%s, published %s)",
+        prefix, post['title'], post['url'], post['published']
+    )
+
+    # Step 1: Classify the post
+    classification = classify_content(
+        content=post['content'],
+        platform='blog',
+        title=post['title'],
+        date=post['published']
+    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "%s   Category: %s, Tags: %s",
+            prefix, classification['category'], ', '.join(classification['tags'])
+        )
+        logger.info("%s   Summary: %s", prefix, classification['summary'])
+
+    # Step 2: Prepare document ID and metadata
+    doc_id = job['doc_id']
+
+    logger.info("%s   Document ID: %s, Token count: %d", prefix, doc_id, job['token_count'])
+
+    job['classification'] = classification
+    job['post_info'] = {
+        'title': post['title'],
+        'url': post['url'],
+        'category': classification['category'],
+        'tags': classification['tags'],
+        'doc_id': doc_id,
+    }
+
+    # Step 3: Check if already exists (Layer 2 deduplication, probed up front)
+    if job['exists']:
+        logger.info("%s   ✓ Already exists - skipping (Layer 2 deduplication)", prefix)
+        job['post_info']['status'] = 'existing'
+        return False
+
+    return True
+
+
+def embed_stage(jobs: List[Dict], embedding_generator: EmbeddingGenerator) -> List[bool]:
+    """Chunk and embed a batch of classified posts.
+
+    Chunks from all posts in the batch share embedding requests.
+
+    Args:
+        jobs: Pipeline jobs from classify_stage()
+        embedding_generator: Embedding generator
+
+    Returns:
+        True for every job (the chunks always move on to the upsert stage)
+    """
+    # Step 4: Generate embeddings with chunking
+    documents = []
+    for job in jobs:
+        post = job['post']
+        classification = job['classification']
+        metadata = {
+            'title': post['title'],
+            'title_norm': normalize_title(post['title']),
+            'url': post['url'],
+            'published': post['published'],
+            'published_ts': post['published_ts'],
+            'category': classification['category'],
+            'tags': classification['tags'],
+            'summary': classification['summary'],
+            'source': 'blog'
+        }
+        documents.append({
+            'text': job['full_text'],
+            'doc_id': job['doc_id'],
+            'metadata': metadata,
+            'token_count': job['token_count']
+        })
+
+    for job, chunks in zip(jobs, embedding_generator.embed_documents(documents)):
+        job['chunks'] = chunks
+        logger.info("%s   ✓ Created %d chunk(s)", job['prefix'], len(chunks))
+
+    return [True] * len(jobs)
+
+
+def upsert_stage(
+    jobs: List[Dict],
+    qdrant_client: RumiQdrantClient,
+    embedding_generator: EmbeddingGenerator,
+    pause_indexing: Callable[[], None]
+) -> List[bool]:
+    """Store a batch of embedded posts' chunks in Qdrant.
+
+    Chunks from all posts in the batch are upserted together, up to
+    UPSERT_BATCH_SIZE points per request.
+
+    Args:
+        jobs: Pipeline jobs from embed_stage()
+        qdrant_client: Qdrant client
+        embedding_generator: Embedding generator (for cost estimation)
+        pause_indexing: Called before writing; pauses HNSW indexing on
+            first use (see sync_blog_to_qdrant)
+
+    Returns:
+        False for every job (this is the last stage)
+    """
+    # Step 5: Upsert to Qdrant (Layer 1 deduplication)
+    all_chunks = [chunk for job in jobs for chunk in job['chunks']]
+    if all_chunks:
+        pause_indexing()
+    failed = set(qdrant_client.upsert_documents(all_chunks, batch_size=UPSERT_BATCH_SIZE))
+
+    for job in jobs:
+        chunks = job['chunks']
+        errors = 0
+        for chunk in chunks:
+            if chunk['chunk_id'] in failed:
+                logger.error("%s   ✗ Failed to store chunk: %s", job['prefix'], chunk['chunk_id'])
+                errors += 1
+
+        tokens = sum(c['tokens'] for c in chunks)
+        job['errors'] = errors
+        job['post_info'].update({
+            'chunks': len(chunks),
+            'tokens': tokens,
+            'cost': embedding_generator.estimate_cost(tokens),
+            'status': 'new'
+        })
+
+        logger.info("%s   ✓ Successfully stored!", job['prefix'])
+
+    return [False] * len(jobs)
+
+
+def start_stage(
+    work: Callable[[List[Dict]], List[bool]],
+    workers: int,
+    in_queue: queue.Queue,
+    out_queue: Optional[queue.Queue],
+    results: List[Dict],
+    timings: Dict[str, float],
+    name: str,
+    batch_size: int = 1
+) -> List[threading.Thread]:
+    """Start a pool of worker threads for one pipeline stage.
+
+    Each worker takes jobs from in_queue until it receives _DONE, grabbing
+    up to batch_size jobs that are already waiting. Jobs for which work()
+    returns True are passed to out_queue; finished, skipped and failed
+    jobs are appended to results.
+
+    Args:
+        work: Stage function; takes a batch of jobs and returns, per job,
+            True to forward it
+        workers: Number of worker threads
+        in_queue: Queue this stage consumes
+        out_queue: Queue of the next stage (None for the last stage)
+        results: Shared list collecting completed jobs
+        timings: Shared dict accumulating seconds spent in work(), by stage
+        name: Stage name (key in timings)
+        batch_size: Maximum number of jobs handed to work() at once
+
+    Returns:
+        The started threads
+    """
+    timings.setdefault(name, 0.0)
+    timings_lock = threading.Lock()
+
+    def run():
+        done = False
+        while not done:
+            job = in_queue.get()
+            if job is _DONE:
+                return
+
+            # Don't wait for a full batch, just take what's already queued
+            batch = [job]
+            while len(batch) < batch_size:
+                try:
+                    job = in_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _DONE:
+                    done = True
+                    break
+                batch.append(job)
+
+            started = time.perf_counter()
+            try:
+                forwards = work(batch)
+            except Exception as e:
+                for job in batch:
+                    logger.error("%s   ✗ Error processing post: %s", job['prefix'], e)
+                    job['error'] = e
+                forwards = [False] * len(batch)
+            elapsed = time.perf_counter() - started
+
+            with timings_lock:
+                timings[name] += elapsed
+
+            for job, forward in zip(batch, forwards):
+                if forward and out_queue is not None:
+                    out_queue.put(job)  # Blocks while the next stage is backed up
+                else:
+                    results.append(job)
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def stop_stage(in_queue: queue.Queue, threads: List[threading.Thread]):
+    """Signal a stage's workers to exit once its queue drains, and wait."""
+    for _ in threads:
+        in_queue.put(_DONE)
+    for thread in threads:
+        thread.join()
+
 
 def sync_blog_to_qdrant(rss_url: str, limit: int = None):
     """Sync blog posts to Qdrant with deduplication.
@@ -44,16 +304,16 @@ def sync_blog_to_qdrant(rss_url: str, limit: int = None):
 
     # Initialize clients
     logger.info("Initializing clients...")
-    qdrant_client = RumiQdrantClient()
+    qdrant_client = RumiQdrantClient(point_cache_path=settings.point_cache_path)
     embedding_generator = EmbeddingGenerator()
 
     # Ensure collection exists
     logger.info("Setting up Qdrant collection...")
     qdrant_client.create_collection()
+    qdrant_client.verify_point_cache()
 
-    # Get initial stats
-    initial_stats = qdrant_client.get_collection_stats()
-    initial_count = initial_stats.get('points_count', 0)
+    # Get initial point count
+    initial_count = qdrant_client.count_points()
     logger.info(f"Initial document count: {initial_count}")
     logger.info("")
 
@@ -84,134 +344,115 @@ def sync_blog_to_qdrant(rss_url: str, limit: int = None):
 
     processed_posts = []
 
-    for i, post in enumerate(posts, 1):
-        logger.info("=" * 80)
-        logger.info(f"PROCESSING POST {i}/{len(posts)}")
-        logger.info("=" * 80)
-        logger.info(f"Title: {post['title']}")
-        logger.info(f"URL: {post['url']}")
-        logger.info(f"Published: {post['published']}")
-        logger.info("")
+    # Stages run concurrently, connected by bounded queues:
+    #   classify (+ existence check) -> embed -> upsert
+    # so embedding one post overlaps with classifying and storing others
+    logger.info(
+        f"Processing {len(posts)} posts "
+        f"(workers: classify={CLASSIFY_WORKERS}, embed={EMBED_WORKERS}, upsert={UPSERT_WORKERS})..."
+    )
+    logger.info("")
 
-        try:
-            # Step 1: Classify the post
-            logger.info("  → Classifying content...")
-            classification = classify_content(
-                content=post['content'],
-                platform='blog',
-                title=post['title'],
-                date=post['published']
-            )
-            logger.info(f"     Category: {classification['category']}")
-            logger.info(f"     Tags: {', '.join(classification['tags'])}")
-            logger.info(f"     Summary: {classification['summary']}")
-
-            stats['categories'][classification['category']] += 1
-
-            # Step 2: Prepare document ID and metadata
-            # Use URL slug as unique identifier
-            url_slug = post['url'].split('/')[-1] if '/' in post['url'] else post['url']
-            doc_id = f"blog:{url_slug}"
-
-            logger.info(f"     Document ID: {doc_id}")
-
-            # Prepare full text (title + content)
-            full_text = f"Title: {post['title']}\n\nContent: {post['content']}"
-            token_count = embedding_generator.count_tokens(full_text)
-            logger.info(f"     Token count: {token_count}")
-
-            # Step 3: Check if already exists (Layer 2 deduplication)
-            logger.info("  → Checking if already stored...")
-            chunk_id = f"{doc_id}:chunk_0"  # Check first chunk
-
-            if qdrant_client.point_exists(chunk_id):
-                logger.info("     ✓ Already exists - skipping (Layer 2 deduplication)")
-                stats['skipped_existing'] += 1
-
-                # Still track it for summary
-                processed_posts.append({
-                    'title': post['title'],
-                    'url': post['url'],
-                    'category': classification['category'],
-                    'tags': classification['tags'],
-                    'doc_id': doc_id,
-                    'status': 'existing'
-                })
-                continue
-
-            # Step 4: Generate embeddings with chunking
-            logger.info("  → Generating embeddings...")
-
-            metadata = {
-                'title': post['title'],
-                'url': post['url'],
-                'published': post['published'],
-                'category': classification['category'],
-                'tags': classification['tags'],
-                'summary': classification['summary'],
-                'source': 'blog'
-            }
-
-            chunks = embedding_generator.embed_document_with_chunking(
-                text=full_text,
-                doc_id=doc_id,
-                metadata=metadata
-            )
-
-            logger.info(f"     ✓ Created {len(chunks)} chunk(s)")
-
-            # Step 5: Upsert to Qdrant (Layer 1 deduplication)
-            logger.info("  → Storing in Qdrant...")
-
-            for chunk in chunks:
-                success = qdrant_client.upsert_document(
-                    chunk_id=chunk['chunk_id'],
-                    embedding=chunk['embedding'],
-                    metadata=chunk['metadata']
-                )
-
-                if not success:
-                    logger.error(f"     ✗ Failed to store chunk: {chunk['chunk_id']}")
-                    stats['errors'] += 1
-
-            # Update stats
-            stats['newly_embedded'] += 1
-            stats['total_chunks'] += len(chunks)
-            stats['total_tokens'] += sum(c['tokens'] for c in chunks)
-
-            chunk_cost = embedding_generator.estimate_cost(
-                sum(c['tokens'] for c in chunks)
-            )
-            stats['total_cost'] += chunk_cost
-
-            processed_posts.append({
-                'title': post['title'],
-                'url': post['url'],
-                'category': classification['category'],
-                'tags': classification['tags'],
+    classify_queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+    embed_queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+    upsert_queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+    results = []
+    timings = {}  # Seconds spent per stage (summed across its workers)
+    pipeline_started = time.perf_counter()
+
+    # Pause HNSW indexing while points stream in, with one indexing pass at
+    # the end. Only paused once the first points are ready to write, so
+    # searches meanwhile (and syncs with nothing new) keep the index.
+    indexing = ExitStack()
+    indexing_lock = threading.Lock()
+    indexing_paused = False
+
+    def pause_indexing():
+        nonlocal indexing_paused
+        with indexing_lock:
+            if not indexing_paused:
+                indexing.enter_context(qdrant_client.bulk_load_context())
+                indexing_paused = True
+
+    with indexing:
+        stages = [
+            (classify_queue, start_stage(
+                lambda jobs: [classify_stage(job) for job in jobs],
+                CLASSIFY_WORKERS, classify_queue, embed_queue, results,
+                timings, 'classify'
+            )),
+            (embed_queue, start_stage(
+                lambda jobs: embed_stage(jobs, embedding_generator),
+                EMBED_WORKERS, embed_queue, upsert_queue, results,
+                timings, 'embed', batch_size=EMBED_BATCH_POSTS
+            )),
+            (upsert_queue, start_stage(
+                lambda jobs: upsert_stage(jobs, qdrant_client, embedding_generator, pause_indexing),
+                UPSERT_WORKERS, upsert_queue, None, results,
+                timings, 'upsert', batch_size=UPSERT_BATCH_POSTS
+            )),
+        ]
+
+        # Layer 2 deduplication for every post in one request (check first chunk)
+        doc_ids = [blog_doc_id(post) for post in posts]
+        existing = qdrant_client.points_exist([f"{doc_id}:chunk_0" for doc_id in doc_ids])
+
+        # Full text (title + content) and its token count, for all posts at once
+        full_texts = [f"Title: {post['title']}\n\nContent: {post['content']}" for post in posts]
+        token_counts = embedding_generator.count_tokens_batch(full_texts)
+
+        for i, post in enumerate(posts, 1):
+            doc_id = doc_ids[i - 1]
+            classify_queue.put({
+                'index': i,
+                'prefix': f"[{i}/{len(posts)}]",
+                'post': post,
                 'doc_id': doc_id,
-                'chunks': len(chunks),
-                'tokens': sum(c['tokens'] for c in chunks),
-                'cost': chunk_cost,
-                'status': 'new'
+                'full_text': full_texts[i - 1],
+                'token_count': token_counts[i - 1],
+                'exists': f"{doc_id}:chunk_0" in existing
             })
 
-            logger.info(f"     ✓ Successfully stored!")
-            logger.info("")
+        # Shut down front to back: a stage has seen all of its input once the
+        # stage before it has exited
+        for in_queue, threads in stages:
+            stop_stage(in_queue, threads)
 
-        except Exception as e:
-            logger.error(f"     ✗ Error processing post: {e}")
+    pipeline_seconds = time.perf_counter() - pipeline_started
+
+    # Aggregate in feed order so the summary matches the RSS feed
+    for job in sorted(results, key=lambda j: j['index']):
+        if 'error' in job:
             stats['errors'] += 1
             continue
 
+        post_info = job['post_info']
+        stats['errors'] += job.get('errors', 0)
+        stats['categories'][post_info['category']] += 1
+        if post_info['status'] == 'existing':
+            stats['skipped_existing'] += 1
+        else:
+            stats['newly_embedded'] += 1
+            stats['total_chunks'] += post_info['chunks']
+            stats['total_tokens'] += post_info['tokens']
+            stats['total_cost'] += post_info['cost']
+
+        processed_posts.append(post_info)
+
+    # Cached tool answers predate the new posts
+    if stats['newly_embedded']:
+        try:
+            clear_result_cache(qdrant_client.client)
+        except Exception as e:
+            logger.warning(f"Failed to clear tool result cache: {e}")
+
     # Get final stats
     logger.info("=" * 80)
     logger.info("SYNC COMPLETE!")
     logger.info("=" * 80)
     logger.info("")
 
-    final_stats = qdrant_client.get_collection_stats()
-    final_count = final_stats.get('points_count', 0)
+    final_count = qdrant_client.count_points()
 
     logger.info("📊 SUMMARY")
     logger.info("=" * 80)
@@ -229,6 +470,11 @@ def sync_blog_to_qdrant(rss_url: str, limit: int = None):
     logger.info(f"  • Total tokens:          {stats['total_tokens']:,}")
     logger.info(f"  • Total cost:            ${stats['total_cost']:.6f}")
     logger.info("")
+    logger.info(f"Stage Timings (summed across workers):")
+    for stage, seconds in timings.items():
+        logger.info(f"  • {stage.capitalize() + ':':<23}{seconds:.2f}s")
+    logger.info(f"  • Pipeline wall clock:   {pipeline_seconds:.2f}s")
+    logger.info("")
     logger.info(f"Qdrant Collection:")
     logger.info(f"  • Before sync:           {initial_count} documents")
     logger.info(f"  • After sync:            {final_count} documents")
@@ -269,7 +515,7 @@ def sync_blog_to_qdrant(rss_url: str, limit: int = None):
     logger.info("   • Click on any point ID")
     logger.info("   • View the vector (1536 dimensions)")
     logger.info("   • Check payload/metadata:")
-    logger.info("     - title, url, published")
+    logger.info("     - title, title_norm, url, published, published_ts")
     logger.info("     - category, tags, summary")
     logger.info("     - chunk_id, source")
     logger.info("")
@@ -8,7 +8,7 @@ This script demonstrates the full chunking + embedding workflow:
 4. Shows how retrieval would work
 """
 
-from src.ingestion.blog import fetch_blog_posts
+from src.ingestion.blog import fetch_blog_posts, url_slug
 from src.storage.embeddings import EmbeddingGenerator
 import logging
 
@@ -37,26 +37,25 @@ def main():
     all_chunks = []
     total_cost = 0
 
-    for i, post in enumerate(posts, 1):
-        logger.info(f"\n{'='*70}")
-        logger.info(f"POST {i}: {post['title']}")
-        logger.info(f"{'='*70}")
+    # Prepare full texts (title + content) and count their tokens in one pass
+    full_texts = [f"Title: {post['title']}\n\nContent: {post['content']}" for post in posts]
+    token_counts = generator.count_tokens_batch(full_texts)
 
-        # Prepare full text (title + content)
-        full_text = f"Title: {post['title']}\n\nContent: {post['content']}"
+    for i, (post, full_text, token_count) in enumerate(zip(posts, full_texts, token_counts), 1):
+        logger.info("\n%s", "=" * 70)
+        logger.info("POST %d: %s", i, post['title'])
+        logger.info("=" * 70)
 
-        # Count tokens
-        token_count = generator.count_tokens(full_text)
-        logger.info(f"Full text: {len(full_text)} chars, {token_count} tokens")
+        logger.info("Full text: %d chars, %d tokens", len(full_text), token_count)
 
         # Check if chunking needed
         if token_count > 6000:
-            logger.info(f"⚠️  Needs chunking (>{6000} tokens limit)")
+            logger.info("⚠️  Needs chunking (>%d tokens limit)", 6000)
         else:
-            logger.info(f"✓ Fits in single chunk (<{6000} tokens)")
+            logger.info("✓ Fits in single chunk (<%d tokens)", 6000)
 
         # Generate embeddings with chunking
-        doc_id = f"blog:{post['url'].split('/')[-1]}"
+        doc_id = f"blog:{url_slug(post['url'])}"
         metadata = {
             "title": post['title'],
             "url": post['url'],
@@ -70,14 +69,13 @@ def main():
         )
 
         # Display chunk info
-        logger.info(f"\nChunks created: {len(chunks)}")
+        logger.info("\nChunks created: %d", len(chunks))
         for chunk in chunks:
             logger.info(
-                f"  • Chunk {chunk['chunk_index']}: "
-                f"{chunk['tokens']} tokens, "
-                f"ID={chunk['chunk_id']}"
+                "  • Chunk %d: %d tokens, ID=%s",
+                chunk['chunk_index'], chunk['tokens'], chunk['chunk_id']
             )
-            logger.info(f"    Preview: {chunk['text'][:100]}...")
+            logger.info("    Preview: %.100s...", chunk['text'])
 
         all_chunks.extend(chunks)
         cost = generator.estimate_cost(sum(c['tokens'] for c in chunks))
@@ -98,7 +96,7 @@ def main():
 
     # Chunking stats
     multi_chunk_posts = sum(1 for p in posts if any(
-        c['total_chunks'] > 1 for c in all_chunks if c['parent_id'].endswith(p['url'].split('/')[-1])
+        c['total_chunks'] > 1 for c in all_chunks if c['parent_id'] == f"blog:{url_slug(p['url'])}"
     ))
 
     logger.info(f"\nChunking stats:")
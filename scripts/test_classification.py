@@ -13,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.blog import fetch_blog_posts
-from src.processing.classifier import classify_content
+from src.processing.classifier import classify_contents
 from src.config.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,35 +42,39 @@ def main():
     print("=" * 70 + "\n")
 
     classified_posts = []
-
-    for i, post in enumerate(posts[:3], 1):
-        print(f"🤖 Classifying Post {i}/{3}: {post['title'][:50]}...")
-
-        try:
-            # Classify the post
-            classification = classify_content(
-                content=post["content"],
-                platform="blog",
-                title=post["title"],
-                date=post["published"],
-            )
-
-            # Combine post data with classification
-            classified_post = {**post, **classification}
-            classified_posts.append(classified_post)
-
-            # Show results
-            print(f"   ✅ Category: {classification['category']}")
-            print(f"   ✅ Tags: {', '.join(classification['tags'])}")
-            print(f"   ✅ Summary: {classification['summary']}")
-            print()
-
-        except Exception as e:
-            print(f"   ❌ Classification failed: {e}")
-            logger.exception(f"Failed to classify post: {post['title']}")
+    test_posts = posts[:3]
+
+    # Classify all test posts concurrently (results come back in order)
+    print(f"🤖 Classifying {len(test_posts)} posts...\n")
+    results = classify_contents([
+        {
+            "content": post["content"],
+            "platform": "blog",
+            "title": post["title"],
+            "date": post["published"],
+        }
+        for post in test_posts
+    ])
+
+    for i, (post, classification) in enumerate(zip(test_posts, results), 1):
+        print(f"Post {i}/{len(test_posts)}: {post['title'][:50]}...")
+
+        if isinstance(classification, Exception):
+            print(f"   ❌ Classification failed: {classification}")
+            logger.error(f"Failed to classify post: {post['title']}: {classification}")
             print()
             continue
 
+        # Combine post data with classification
+        classified_post = {**post, **classification}
+        classified_posts.append(classified_post)
+
+        # Show results
+        print(f"   ✅ Category: {classification['category']}")
+        print(f"   ✅ Tags: {', '.join(classification['tags'])}")
+        print(f"   ✅ Summary: {classification['summary']}")
+        print()
+
     # Step 3: Summary
     print("=" * 70)
     print("Classification Summary")
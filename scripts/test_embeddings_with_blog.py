@@ -13,17 +13,17 @@ from src.ingestion.blog import fetch_blog_posts
 from src.storage.embeddings import EmbeddingGenerator
 from src.config.settings import settings
 import logging
-import numpy as np
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def cosine_similarity(vec1, vec2):
-    """Calculate cosine similarity between two vectors."""
-    vec1 = np.array(vec1)
-    vec2 = np.array(vec2)
-    return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+def normalize(vec):
+    """Scale a vector to unit length (cosine similarity becomes a dot product)."""
+    import numpy as np
+
+    vec = np.asarray(vec, dtype=np.float32)
+    return vec / max(np.linalg.norm(vec), 1e-12)
 
 
 def main():
@@ -32,7 +32,8 @@ def main():
     # Step 1: Fetch blog posts
     logger.info("1. Fetching blog posts...")
     rss_url = "https://agamjn.com/feed"  # Your blog RSS
-    posts = fetch_blog_posts(rss_url)
+    force_refresh = "--force-refresh" in sys.argv  # Skip the cached feed
+    posts = fetch_blog_posts(rss_url, force_refresh=force_refresh)
 
     if not posts:
         logger.error("No posts fetched!")
@@ -42,52 +43,61 @@ def main():
     test_posts = posts[:3]
     logger.info(f"   ✓ Fetched {len(test_posts)} posts for testing")
 
-    for i, post in enumerate(test_posts, 1):
-        logger.info(f"   Post {i}: {post['title'][:60]}...")
-
     # Step 2: Generate embeddings
     logger.info("\n2. Generating embeddings...")
     generator = EmbeddingGenerator()
 
+    # Filled in one pass over the posts, then used column-wise below
     embeddings = []
-    total_tokens = 0
+    titles = []
+    token_counts = []
     total_cost = 0
 
-    for i, post in enumerate(test_posts, 1):
-        logger.info(f"\n   Post {i}: {post['title']}")
-
-        # Combine title + summary for embedding (saves tokens vs full content)
-        text_to_embed = f"{post['title']} {post['summary']}"
+    # Combine title + summary for embedding (saves tokens vs full content)
+    texts_to_embed = [f"{post['title']} {post['summary']}" for post in test_posts]
 
-        # Generate embedding with metadata
-        result = generator.generate_with_metadata(text_to_embed)
-        embeddings.append(result['embedding'])
+    # Generate all embeddings (with metadata) in one API call
+    results = generator.generate_batch_with_metadata(texts_to_embed)
 
-        total_tokens += result['token_count']
+    for i, (post, result) in enumerate(zip(test_posts, results), 1):
+        embeddings.append(normalize(result['embedding']))
+        titles.append(post['title'][:40])
+        token_counts.append(result['token_count'])
         total_cost += result['cost_usd']
 
-        logger.info(f"      Tokens: {result['token_count']}")
-        logger.info(f"      Cost: ${result['cost_usd']:.8f}")
-        logger.info(f"      First 3 values: {result['embedding'][:3]}")
+        # One record per post, formatted only if INFO is enabled
+        logger.info(
+            "\n   Post %d: %s\n      Tokens: %d\n      Cost: $%.8f\n      First 3 values: %s",
+            i, post['title'], result['token_count'], result['cost_usd'],
+            result['embedding'][:3]
+        )
 
     # Step 3: Calculate similarities
     logger.info("\n3. Calculating semantic similarities...")
     logger.info("   (Higher score = more similar topics)\n")
 
-    for i in range(len(test_posts)):
-        for j in range(i + 1, len(test_posts)):
-            similarity = cosine_similarity(embeddings[i], embeddings[j])
-            logger.info(f"   Post {i+1} ↔ Post {j+1}: {similarity:.4f}")
-            logger.info(f"      '{test_posts[i]['title'][:40]}...'")
-            logger.info(f"      vs")
-            logger.info(f"      '{test_posts[j]['title'][:40]}...'\n")
+    import numpy as np
+
+    # Embeddings are unit length, so E @ E.T is every pairwise cosine similarity
+    matrix = np.stack(embeddings)
+    sim_matrix = matrix @ matrix.T
+
+    # Scores of every pair (upper triangle) gathered in one indexing operation
+    i_idx, j_idx = np.triu_indices(len(test_posts), k=1)
+    scores = sim_matrix[i_idx, j_idx]
+
+    for i, j, similarity in zip(i_idx.tolist(), j_idx.tolist(), scores.tolist()):
+        logger.info(
+            "   Post %d ↔ Post %d: %.4f\n      '%s...'\n      vs\n      '%s...'\n",
+            i + 1, j + 1, similarity, titles[i], titles[j]
+        )
 
     # Step 4: Summary
     logger.info("=" * 70)
     logger.info("📊 SUMMARY")
     logger.info("=" * 70)
     logger.info(f"Posts processed: {len(test_posts)}")
-    logger.info(f"Total tokens: {total_tokens}")
+    logger.info(f"Total tokens: {sum(token_counts)}")
     logger.info(f"Total cost: ${total_cost:.8f}")
     logger.info(f"Cost per post: ${total_cost / len(test_posts):.8f}")
     logger.info(f"\nEstimate for 100 posts: ${(total_cost / len(test_posts)) * 100:.6f}")
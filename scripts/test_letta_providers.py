@@ -9,23 +9,50 @@ This script demonstrates how to:
 Run with: PYTHONPATH=/Users/agamjain/Downloads/rumi venv/bin/python scripts/test_letta_providers.py
 """
 
-from src.agents.letta_client import RumiLettaClient, LettaConfig
+from scripts._common import message_content
+from src.agents.letta_client import LettaConfig, RumiLettaClient, get_default_client
 from src.config.settings import settings
+from contextlib import contextmanager
+from typing import Dict, List
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def test_provider_detection():
-    """Test which providers are available."""
+@contextmanager
+def temporary_agent(client: RumiLettaClient, name: str, memory_blocks: List[Dict[str, str]]):
+    """Create an agent for the duration of a with-block, then delete it.
+
+    Args:
+        client: Letta client to create the agent with
+        name: Agent name
+        memory_blocks: Memory blocks for the agent
+
+    Yields:
+        The created agent
+    """
+    agent = client.create_agent(name=name, memory_blocks=memory_blocks)
+    try:
+        yield agent
+    finally:
+        logger.info("Cleaning up test agent...")
+        client.delete_agent(agent.id)
+        logger.info("✓ Test agent deleted")
+        logger.info("")
+
+
+def test_provider_detection(available):
+    """Test which providers are available.
+
+    Args:
+        available: Result of LettaConfig.get_available_providers()
+    """
     logger.info("=" * 80)
     logger.info("PROVIDER DETECTION TEST")
     logger.info("=" * 80)
     logger.info("")
 
-    available = LettaConfig.get_available_providers()
-
     logger.info("Available providers:")
     for provider, is_available in available.items():
         status = "✓" if is_available else "✗"
@@ -68,7 +95,7 @@ def test_client_initialization():
     logger.info("")
 
     try:
-        client = RumiLettaClient()
+        client = get_default_client()
         logger.info("✓ Client initialized successfully")
         logger.info(f"  Base URL: {client.base_url}")
         logger.info(f"  Provider: {client.provider}")
@@ -100,7 +127,7 @@ def test_agent_creation():
     logger.info("")
 
     try:
-        client = RumiLettaClient()
+        client = get_default_client()
 
         # Define memory blocks
         memory_blocks = [
@@ -131,36 +158,25 @@ def test_agent_creation():
         logger.info(f"Provider: {settings.llm_provider}")
         logger.info("")
 
-        agent = client.create_agent(
-            name=agent_name,
-            memory_blocks=memory_blocks
-        )
-
-        logger.info(f"✓ Agent created successfully!")
-        logger.info(f"  Agent ID: {agent.id}")
-        logger.info(f"  Agent Name: {agent.name}")
-        logger.info("")
-
-        # Test sending a message
-        logger.info("Sending test message...")
-        response = client.send_message(
-            agent.id,
-            "Hi, I'm Agam. What's your name and purpose?"
-        )
-
-        logger.info("Agent response:")
-        for msg in response:
-            if hasattr(msg, 'content'):
-                logger.info(f"  {msg.content}")
-            elif hasattr(msg, 'text'):
-                logger.info(f"  {msg.text}")
-        logger.info("")
+        with temporary_agent(client, agent_name, memory_blocks) as agent:
+            logger.info(f"✓ Agent created successfully!")
+            logger.info(f"  Agent ID: {agent.id}")
+            logger.info(f"  Agent Name: {agent.name}")
+            logger.info("")
 
-        # Clean up
-        logger.info("Cleaning up test agent...")
-        client.delete_agent(agent.id)
-        logger.info("✓ Test agent deleted")
-        logger.info("")
+            # Test sending a message
+            logger.info("Sending test message...")
+            response = client.send_message(
+                agent.id,
+                "Hi, I'm Agam. What's your name and purpose?"
+            )
+
+            logger.info("Agent response:")
+            for msg in response:
+                content = message_content(msg)
+                if content is not None:
+                    logger.info(f"  {content}")
+            logger.info("")
 
     except Exception as e:
         logger.error(f"✗ Agent creation failed: {e}")
@@ -171,18 +187,21 @@ def test_agent_creation():
     return True
 
 
-def test_provider_switching():
-    """Test switching between providers."""
+def test_provider_switching(available):
+    """Test switching between providers.
+
+    Args:
+        available: Result of LettaConfig.get_available_providers()
+    """
     logger.info("=" * 80)
     logger.info("PROVIDER SWITCHING TEST")
     logger.info("=" * 80)
     logger.info("")
 
     try:
-        client = RumiLettaClient()
+        client = get_default_client()
         original_provider = client.provider
 
-        available = LettaConfig.get_available_providers()
         available_providers = [k for k, v in available.items() if v]
 
         logger.info(f"Original provider: {original_provider}")
@@ -221,8 +240,10 @@ def main():
     logger.info("*" * 80)
     logger.info("\n")
 
+    available = LettaConfig.get_available_providers()
+
     # Test 1: Provider detection
-    test_provider_detection()
+    test_provider_detection(available)
 
     # Test 2: Model configuration
     test_model_configuration()
@@ -236,7 +257,7 @@ def main():
     test_agent_creation()
 
     # Test 5: Provider switching
-    test_provider_switching()
+    test_provider_switching(available)
 
     logger.info("=" * 80)
     logger.info("✓ ALL TESTS COMPLETE")
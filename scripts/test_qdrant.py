@@ -13,11 +13,10 @@ Run: python scripts/test_qdrant.py
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    Batch,
     Distance,
     VectorParams,
-    PointStruct,
 )
-import numpy as np
 import logging
 
 # Set up logging
@@ -29,8 +28,9 @@ def main():
     """Test Qdrant basic operations."""
 
     # Step 1: Connect to Qdrant
-    logger.info("1. Connecting to Qdrant at localhost:6333...")
-    client = QdrantClient(host="localhost", port=6333)
+    logger.info("1. Connecting to Qdrant at localhost:6333 (gRPC on 6334)...")
+    # gRPC sends vectors as packed protobuf floats instead of JSON text
+    client = QdrantClient(host="localhost", port=6333, grpc_port=6334, prefer_grpc=True)
 
     # Verify connection
     try:
@@ -49,22 +49,20 @@ def main():
     logger.info(f"   Distance metric: Cosine (best for embeddings)")
 
     try:
-        # Delete if exists (for clean testing)
-        try:
-            client.delete_collection(collection_name)
-            logger.info(f"   (Deleted existing collection)")
-        except:
-            pass
-
-        # Create collection
-        client.create_collection(
-            collection_name=collection_name,
-            vectors_config=VectorParams(
-                size=vector_size,
-                distance=Distance.COSINE  # Common for embeddings
+        # Reuse the collection from a previous run: the test always upserts
+        # the same point IDs, so existing points are simply overwritten
+        existing = {c.name for c in info.collections}
+        if collection_name in existing:
+            logger.info("✓ Collection already exists, reusing it")
+        else:
+            client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(
+                    size=vector_size,
+                    distance=Distance.COSINE  # Common for embeddings
+                )
             )
-        )
-        logger.info("✓ Collection created successfully!")
+            logger.info("✓ Collection created successfully!")
     except Exception as e:
         logger.error(f"✗ Failed to create collection: {e}")
         return
@@ -76,51 +74,47 @@ def main():
     # For testing, we'll use random vectors that are similar
 
     # Create 3 similar vectors (imagine these are blog posts about vLLM)
-    base_vector = np.random.rand(vector_size).tolist()
+    import numpy as np  # Only needed once Qdrant is reachable
+
+    rng = np.random.default_rng(42)  # Seeded, so scores are reproducible
+    base_vector = rng.random(vector_size, dtype=np.float32)
 
     # Point 1: "Optimizing reranker inference with vLLM"
-    vector1 = [x + np.random.normal(0, 0.01) for x in base_vector]
-    point1 = PointStruct(
-        id=1,
-        vector=vector1,
-        payload={
-            "title": "Optimizing reranker inference with vLLM",
-            "category": "work",
-            "tags": ["vllm", "reranker", "fastapi"],
-            "url": "https://agamjn.com/post1"
-        }
-    )
+    vector1 = (base_vector + rng.normal(0, 0.01, vector_size)).astype(np.float32).tolist()
+    payload1 = {
+        "title": "Optimizing reranker inference with vLLM",
+        "category": "work",
+        "tags": ["vllm", "reranker", "fastapi"],
+        "url": "https://agamjn.com/post1"
+    }
 
     # Point 2: "RAG vs Memory" (slightly different topic)
-    vector2 = [x + np.random.normal(0, 0.3) for x in base_vector]
-    point2 = PointStruct(
-        id=2,
-        vector=vector2,
-        payload={
-            "title": "RAG vs Memory: Addressing Token Crisis",
-            "category": "work",
-            "tags": ["rag", "memory", "token_management"],
-            "url": "https://agamjn.com/post2"
-        }
-    )
+    vector2 = (base_vector + rng.normal(0, 0.3, vector_size)).astype(np.float32).tolist()
+    payload2 = {
+        "title": "RAG vs Memory: Addressing Token Crisis",
+        "category": "work",
+        "tags": ["rag", "memory", "token_management"],
+        "url": "https://agamjn.com/post2"
+    }
 
     # Point 3: "Detachment Is All You Need" (very different - personal)
-    vector3 = np.random.rand(vector_size).tolist()  # Random, unrelated
-    point3 = PointStruct(
-        id=3,
-        vector=vector3,
-        payload={
-            "title": "Detachment Is All You Need",
-            "category": "personal",
-            "tags": ["detachment", "philosophy", "mindfulness"],
-            "url": "https://agamjn.com/post3"
-        }
-    )
+    vector3 = rng.random(vector_size, dtype=np.float32).tolist()  # Random, unrelated
+    payload3 = {
+        "title": "Detachment Is All You Need",
+        "category": "personal",
+        "tags": ["detachment", "philosophy", "mindfulness"],
+        "url": "https://agamjn.com/post3"
+    }
 
     try:
+        # Columnar batch: one request for all three points
         client.upsert(
             collection_name=collection_name,
-            points=[point1, point2, point3]
+            points=Batch(
+                ids=[1, 2, 3],
+                vectors=[vector1, vector2, vector3],
+                payloads=[payload1, payload2, payload3]
+            )
         )
         logger.info("✓ Inserted 3 points successfully!")
         logger.info("   - Post 1 & 2 are similar (both technical)")
@@ -138,7 +132,9 @@ def main():
         results = client.search(
             collection_name=collection_name,
             query_vector=vector1,
-            limit=3  # Get top 3 results
+            limit=3,  # Get top 3 results
+            with_payload=["title", "category"],  # Only the fields we print
+            with_vectors=False
         )
 
         logger.info(f"\n   Results (top 3 by similarity):")
@@ -174,7 +170,9 @@ def main():
                     )
                 ]
             ),
-            limit=3
+            limit=3,
+            with_payload=["title"],
+            with_vectors=False
         )
 
         logger.info(f"   Found {len(results)} work-related posts:")
@@ -1,5 +1,4 @@
 """Test the Qdrant client with deduplication."""
-import numpy as np
 import logging
 import sys
 
@@ -9,10 +8,30 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def random_unit_vector(rng, dim: int = 1536):
+    """Random test embedding, normalized like real (OpenAI) embeddings.
+
+    Args:
+        rng: numpy Generator (seeded, so runs are reproducible)
+        dim: Vector dimensions
+
+    Returns:
+        float32 ndarray (convert with .tolist() only where a list is required)
+    """
+    import numpy as np
+
+    vec = rng.standard_normal(dim, dtype=np.float32)
+    vec /= np.linalg.norm(vec)
+    return vec
+
+
 def test_deduplication():
     """Test that deduplication works (Layer 1 + Layer 2)."""
 
-    client = RumiQdrantClient()
+    import numpy as np
+
+    client = RumiQdrantClient(prefer_grpc=True)
+    rng = np.random.default_rng(0)
 
     # Create collection
     logger.info("\n" + "="*70)
@@ -21,7 +40,7 @@ def test_deduplication():
     client.create_collection()
 
     # Test data
-    embedding1 = np.random.rand(1536).tolist()
+    embedding1 = random_unit_vector(rng)
     metadata1 = {
         "title": "Test Post",
         "category": "work",
@@ -36,40 +55,41 @@ def test_deduplication():
     logger.info("\n" + "="*70)
     logger.info("STEP 2: First upsert")
     logger.info("="*70)
-    client.upsert_document(chunk_id, embedding1, metadata1)
+    client.upsert_document(chunk_id, embedding1.tolist(), metadata1)
 
     # Check stats (should be 1 document)
-    stats = client.get_collection_stats()
-    logger.info(f"   Points count: {stats.get('points_count')}")
-    assert stats.get('points_count') == 1, "Should have 1 point after first upsert"
+    points_count = client.count_points()
+    logger.info(f"   Points count: {points_count}")
+    assert points_count == 1, "Should have 1 point after first upsert"
 
     # Step 2: Check existence (Layer 2 deduplication)
     logger.info("\n" + "="*70)
     logger.info("STEP 3: Check existence (Layer 2 deduplication)")
     logger.info("="*70)
-    exists = client.point_exists(chunk_id)
-    logger.info(f"   Document exists: {exists}")
-    assert exists, "Document should exist"
+    missing_id = "test:post_1:chunk_99"
+    existing = client.points_exist([chunk_id, missing_id])
+    logger.info(f"   Existing documents: {sorted(existing)}")
+    assert existing == {chunk_id}, "Only the upserted document should exist"
 
     # Step 3: Second upsert with updated content (Layer 1 deduplication)
     logger.info("\n" + "="*70)
     logger.info("STEP 4: Second upsert with updated content (Layer 1 deduplication)")
     logger.info("="*70)
     metadata1["content"] = "Updated content - this should replace, not duplicate!"
-    client.upsert_document(chunk_id, embedding1, metadata1)
+    client.upsert_document(chunk_id, embedding1.tolist(), metadata1)
 
     # Check stats again (should STILL be 1 document, not 2!)
     logger.info("\n" + "="*70)
     logger.info("STEP 5: Verify no duplicates")
     logger.info("="*70)
-    stats = client.get_collection_stats()
-    logger.info(f"   Points count: {stats.get('points_count')}")
+    points_count = client.count_points()
+    logger.info(f"   Points count: {points_count}")
     logger.info(f"   Expected: 1 (upsert should update, not create duplicate)")
 
-    if stats.get('points_count') == 1:
+    if points_count == 1:
         logger.info("   ✓ DEDUPLICATION WORKS! No duplicate created.")
     else:
-        logger.error(f"   ✗ DEDUPLICATION FAILED! Found {stats.get('points_count')} documents instead of 1")
+        logger.error(f"   ✗ DEDUPLICATION FAILED! Found {points_count} documents instead of 1")
         sys.exit(1)
 
     # Step 4: Test search to verify updated content
@@ -97,7 +117,7 @@ def test_deduplication():
     logger.info("STEP 7: Add different chunk from same document")
     logger.info("="*70)
     chunk_id_2 = "test:post_1:chunk_1"
-    embedding2 = np.random.rand(1536).tolist()
+    embedding2 = random_unit_vector(rng)
     metadata2 = {
         "title": "Test Post",
         "category": "work",
@@ -105,12 +125,12 @@ def test_deduplication():
         "content": "This is chunk 1 content",
         "source": "blog"
     }
-    client.upsert_document(chunk_id_2, embedding2, metadata2)
+    client.upsert_document(chunk_id_2, embedding2.tolist(), metadata2)
 
-    stats = client.get_collection_stats()
-    logger.info(f"   Points count: {stats.get('points_count')}")
+    points_count = client.count_points()
+    logger.info(f"   Points count: {points_count}")
     logger.info(f"   Expected: 2 (different chunk IDs)")
-    assert stats.get('points_count') == 2, "Should have 2 points for different chunk IDs"
+    assert points_count == 2, "Should have 2 points for different chunk IDs"
 
     # Final summary
     logger.info("\n" + "="*70)
@@ -118,7 +138,7 @@ def test_deduplication():
     logger.info("="*70)
     logger.info("Deduplication Strategy Verified:")
     logger.info("  ✓ Layer 1: upsert() prevents duplicates in Qdrant")
-    logger.info("  ✓ Layer 2: point_exists() can check before embedding")
+    logger.info("  ✓ Layer 2: points_exist() can check before embedding")
     logger.info("  ✓ Same chunk_id → update, not duplicate")
     logger.info("  ✓ Different chunk_id → separate documents")
     logger.info("")
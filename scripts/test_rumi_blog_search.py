@@ -1,6 +1,7 @@
 """Test Rumi's ability to search blog content."""
 
-from src.agents.letta_client import RumiLettaClient
+from scripts._common import print_streamed_reply
+from src.agents.letta_client import get_default_client
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -12,11 +13,10 @@ def test_blog_search():
     print("TESTING RUMI BLOG SEARCH")
     print("=" * 80 + "\n")
 
-    client = RumiLettaClient()
+    client = get_default_client()
 
     # Find Rumi
-    agents = client.list_agents()
-    rumi = next((a for a in agents if a.name == "rumi"), None)
+    rumi = client.get_agent_by_name("rumi")
 
     if not rumi:
         print("✗ Rumi not found!")
@@ -37,13 +37,8 @@ def test_blog_search():
         print("=" * 80)
         print(f"You: {query}\n")
 
-        response = client.send_message(rumi.id, query)
-
-        print("Rumi:")
-        for msg in response:
-            content = getattr(msg, 'content', getattr(msg, 'text', None))
-            if content:
-                print(f"  {content}")
+        # Print the reply as it streams in
+        print_streamed_reply(client, rumi.id, query)
         print("\n")
 
     print("=" * 80)
@@ -1,6 +1,7 @@
 """Quick test of Rumi conversation."""
 
-from src.agents.letta_client import RumiLettaClient
+from scripts._common import print_streamed_reply
+from src.agents.letta_client import get_default_client
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -12,11 +13,10 @@ def test_conversation():
     print("TESTING RUMI CONVERSATION")
     print("=" * 80 + "\n")
 
-    client = RumiLettaClient()
+    client = get_default_client()
 
     # Find Rumi
-    agents = client.list_agents()
-    rumi = next((a for a in agents if a.name == "rumi"), None)
+    rumi = client.get_agent_by_name("rumi")
 
     if not rumi:
         print("✗ Rumi not found!")
@@ -35,13 +35,8 @@ def test_conversation():
         print(f"\n[Test {i}]")
         print(f"You: {message}\n")
 
-        response = client.send_message(rumi.id, message)
-
-        print("Rumi:")
-        for msg in response:
-            content = getattr(msg, 'content', getattr(msg, 'text', None))
-            if content:
-                print(f"  {content}")
+        # Print the reply as it streams in
+        print_streamed_reply(client, rumi.id, message)
         print("")
 
     print("=" * 80)
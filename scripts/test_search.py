@@ -6,6 +6,7 @@ Run with: PYTHONPATH=/Users/agamjain/Downloads/rumi venv/bin/python scripts/test
 
 from src.storage.qdrant_client import RumiQdrantClient
 from src.storage.embeddings import EmbeddingGenerator
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -48,7 +49,24 @@ def test_search():
         }
     ]
 
-    for i, test in enumerate(test_queries, 1):
+    # Embed every query in one request
+    query_embeddings = generator.generate_embeddings_batch(
+        [test['query'] for test in test_queries]
+    )
+
+    def run_query(test, query_embedding):
+        """Search for one query."""
+        return client.search(
+            query_vector=query_embedding,
+            limit=3,
+            category=test['category']
+        )
+
+    # Searches are independent, so run them concurrently and print in order
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+        all_results = list(executor.map(run_query, test_queries, query_embeddings))
+
+    for i, (test, results) in enumerate(zip(test_queries, all_results), 1):
         logger.info("=" * 80)
         logger.info(f"QUERY {i}: {test['query']}")
         logger.info("=" * 80)
@@ -57,16 +75,6 @@ def test_search():
             logger.info(f"Filter: category={test['category']}")
         logger.info("")
 
-        # Generate query embedding
-        query_embedding = generator.generate_embedding(test['query'])
-
-        # Search
-        results = client.search(
-            query_vector=query_embedding,
-            limit=3,
-            category=test['category']
-        )
-
         # Display results
         logger.info(f"Found {len(results)} results:\n")
 
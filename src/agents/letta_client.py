@@ -10,7 +10,8 @@ Features:
 - Consistent API regardless of provider
 """
 
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, Iterator, List
 import logging
 
 try:
@@ -156,6 +157,8 @@ class RumiLettaClient:
         logger.info(f"Connecting to Letta server at {self.base_url}")
         logger.info(f"Using LLM provider: {self.provider}")
 
+        # The SDK keeps its own connection pool (with its 60s timeout);
+        # scripts share it through get_default_client()
         self.client = Letta(
             base_url=self.base_url,
             token=self.token
@@ -237,6 +240,35 @@ class RumiLettaClient:
 
         return response.messages
 
+    def stream_message(
+        self,
+        agent_id: str,
+        message: str,
+        role: str = "user"
+    ) -> Iterator:
+        """Send a message to an agent and stream the response.
+
+        Unlike send_message(), chunks are yielded as the server produces
+        them (token streaming), so callers can display the reply as it is
+        generated instead of waiting for the full response.
+
+        Args:
+            agent_id: Agent ID
+            message: Message text
+            role: Message role (default: "user")
+
+        Yields:
+            Streaming message chunks from the agent (assistant chunks carry
+            incremental ``content``)
+        """
+        logger.info(f"Streaming message to agent {agent_id}")
+
+        yield from self.client.agents.messages.create_stream(
+            agent_id=agent_id,
+            messages=[{"role": role, "content": message}],
+            stream_tokens=True
+        )
+
     def list_agents(self) -> List[Dict]:
         """List all agents on the server.
 
@@ -253,12 +285,92 @@ class RumiLettaClient:
 
         Returns:
             Agent object
+
+        Raises:
+            ValueError: If no agent has that ID
         """
-        agents = self.client.agents.list()
-        agent = next((a for a in agents if a.id == agent_id), None)
-        if not agent:
-            raise ValueError(f"Agent not found: {agent_id}")
-        return agent
+        try:
+            return self.client.agents.retrieve(agent_id)
+        except Exception as e:
+            if getattr(e, "status_code", None) == 404:
+                raise ValueError(f"Agent not found: {agent_id}") from e
+            raise
+
+    def get_agent_by_name(self, name: str) -> Optional[Dict]:
+        """Get agent by name.
+
+        Uses the server-side ``name`` filter so only the matching agent is
+        returned; falls back to scanning all agents on older servers.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Agent object, or None if no agent has that name
+        """
+        try:
+            agents = self.client.agents.list(name=name, limit=1)
+        except TypeError:
+            # Older letta-client without the name filter
+            logger.debug("agents.list(name=...) unsupported, scanning all agents")
+            agents = self.client.agents.list()
+        return next((a for a in agents if a.name == name), None)
+
+    def get_tools_by_names(self, names: Iterable[str]) -> Dict[str, object]:
+        """Look up tools by name.
+
+        Uses the server-side ``name`` filter when available so only the
+        requested tools are transferred; falls back to a single full
+        listing indexed by name.
+
+        Args:
+            names: Tool names to look up
+
+        Returns:
+            Dict mapping tool name to tool object (missing names are omitted)
+        """
+        names = set(names)
+        try:
+            found = {}
+            for name in names:
+                for tool in self.client.tools.list(name=name):
+                    if tool.name == name:
+                        found[name] = tool
+                        break
+            return found
+        except TypeError:
+            # Older letta-client without the name filter
+            logger.debug("tools.list(name=...) unsupported, scanning all tools")
+            return {t.name: t for t in self.client.tools.list() if t.name in names}
+
+    def attach_tools(self, agent_id: str, tools: Iterable) -> Dict[str, Optional[Exception]]:
+        """Attach several tools to an agent concurrently.
+
+        Each attach is an independent request, so they are issued from a
+        thread pool instead of one after another.
+
+        Args:
+            agent_id: Agent ID
+            tools: Tool objects (with ``id`` and ``name``) to attach
+
+        Returns:
+            Dict mapping tool name to None on success, or the raised exception
+        """
+        tools = list(tools)
+        if not tools:
+            return {}
+
+        def attach(tool):
+            try:
+                self.client.agents.tools.attach(agent_id=agent_id, tool_id=tool.id)
+                return None
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            errors = list(executor.map(attach, tools))
+
+        return {tool.name: error for tool, error in zip(tools, errors)}
 
     def delete_agent(self, agent_id: str):
         """Delete an agent.
@@ -299,3 +411,21 @@ def get_letta_client(provider: Optional[str] = None) -> RumiLettaClient:
         Configured RumiLettaClient instance
     """
     return RumiLettaClient(provider=provider)
+
+
+_default_client: Optional[RumiLettaClient] = None
+
+
+def get_default_client() -> RumiLettaClient:
+    """Get the process-wide Letta client, creating it on first use.
+
+    Scripts should use this instead of constructing RumiLettaClient()
+    directly so they share a single connection pool.
+
+    Returns:
+        Shared RumiLettaClient instance (default provider)
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = RumiLettaClient()
+    return _default_client
@@ -2,9 +2,24 @@
 Custom Letta tools for Qdrant RAG integration.
 
 These are simple Python functions that Letta will execute.
+Helpers they share live in tool_runtime.py, which is uploaded with them.
 """
 from typing import Optional
 
+from src.agents.tool_runtime import (
+    CONTENT_SEARCH_PARAMS,
+    POST_PAYLOAD_FIELDS,
+    cache_result,
+    category_filter,
+    embed_query,
+    find_post_by_title,
+    format_error,
+    get_cached_result,
+    get_qdrant,
+    published_timestamp,
+    scroll_recent_posts,
+)
+
 
 def search_blog_posts(query: str, category: Optional[str] = None, limit: int = 3) -> str:
     """
@@ -21,64 +36,53 @@ def search_blog_posts(query: str, category: Optional[str] = None, limit: int = 3
     Returns:
         str: Formatted search results with titles, summaries, and URLs
     """
-    import os
-    from qdrant_client import QdrantClient
-    from openai import OpenAI
-
     try:
-        # Connect to Qdrant
-        qdrant_host = os.getenv('QDRANT_HOST', 'localhost')
-        qdrant_port = int(os.getenv('QDRANT_PORT', '6333'))
-        qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
-
-        # Connect to OpenAI for embeddings
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        embedding_model = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+        # Shared Qdrant client (connections reused across calls)
+        qdrant = get_qdrant()
 
-        # Generate embedding
-        response = openai_client.embeddings.create(input=query, model=embedding_model)
-        query_embedding = response.data[0].embedding
+        # Generate embedding (cached per query)
+        query_embedding = embed_query(query)
 
-        # Build filter
-        must_conditions = []
-        if category:
-            must_conditions.append({
-                "key": "category",
-                "match": {"value": category}
-            })
-
-        query_filter = {"must": must_conditions} if must_conditions else None
+        # Reuse the answer to a near-identical earlier query
+        cache_params = {"category": category or "", "limit": limit}
+        cached = get_cached_result(qdrant, "search_blog_posts", query_embedding, cache_params)
+        if cached is not None:
+            return cached
 
         # Search Qdrant
-        search_results = qdrant.search(
+        search_results = qdrant.query_points(
             collection_name="rumi_content",
-            query_vector=query_embedding,
+            query=query_embedding,
             limit=limit,
-            query_filter=query_filter
-        )
+            query_filter=category_filter(category),
+            search_params=CONTENT_SEARCH_PARAMS,
+            with_payload=POST_PAYLOAD_FIELDS,
+            with_vectors=False
+        ).points
 
         if not search_results:
             return f"No blog posts found matching '{query}'."
 
         # Format results
-        output = f"Found {len(search_results)} relevant blog post(s):\n\n"
+        parts = [f"Found {len(search_results)} relevant blog post(s):\n\n"]
 
         for i, hit in enumerate(search_results, 1):
             metadata = hit.payload
             score = hit.score
 
-            output += f"{i}. **{metadata['title']}** (Relevance: {score:.2f})\n"
-            output += f"   Category: {metadata['category']}\n"
-            output += f"   Summary: {metadata['summary']}\n"
-            output += f"   Tags: {', '.join(metadata['tags'][:5])}\n"
-            output += f"   URL: {metadata['url']}\n"
-            output += f"   Published: {metadata['published']}\n\n"
+            parts.append(f"{i}. **{metadata['title']}** (Relevance: {score:.2f})\n")
+            parts.append(f"   Category: {metadata['category']}\n")
+            parts.append(f"   Summary: {metadata['summary']}\n")
+            parts.append(f"   Tags: {', '.join(metadata['tags'][:5])}\n")
+            parts.append(f"   URL: {metadata['url']}\n")
+            parts.append(f"   Published: {metadata['published']}\n\n")
 
+        output = "".join(parts)
+        cache_result(qdrant, "search_blog_posts", query, query_embedding, cache_params, output)
         return output
 
     except Exception as e:
-        import traceback
-        return f"Error searching blog posts: {str(e)}\n{traceback.format_exc()}"
+        return format_error("Error searching blog posts", e)
 
 
 def get_blog_post_content(title: str) -> str:
@@ -93,51 +97,55 @@ def get_blog_post_content(title: str) -> str:
     Returns:
         str: Post details including title, summary, category, tags, and URL
     """
-    import os
-    from qdrant_client import QdrantClient
-    from openai import OpenAI
-
     try:
-        # Connect to Qdrant
-        qdrant_host = os.getenv('QDRANT_HOST', 'localhost')
-        qdrant_port = int(os.getenv('QDRANT_PORT', '6333'))
-        qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
-
-        # Connect to OpenAI for embeddings
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        embedding_model = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
-
-        # Generate embedding for title search
-        response = openai_client.embeddings.create(input=title, model=embedding_model)
-        query_embedding = response.data[0].embedding
-
-        # Search Qdrant
-        search_results = qdrant.search(
-            collection_name="rumi_content",
-            query_vector=query_embedding,
-            limit=1
-        )
-
-        if not search_results:
-            return f"Blog post not found: '{title}'"
-
-        # Get the best match
-        hit = search_results[0]
-        metadata = hit.payload
+        # Shared Qdrant client (connections reused across calls)
+        qdrant = get_qdrant()
+
+        # Fast path: the title text matches one post, no embedding needed
+        metadata = find_post_by_title(qdrant, title)
+        query_embedding = None
+
+        if metadata is None:
+            # Generate embedding for title search (cached per title)
+            query_embedding = embed_query(title)
+
+            # Reuse the answer to a near-identical earlier lookup
+            cached = get_cached_result(qdrant, "get_blog_post_content", query_embedding, {})
+            if cached is not None:
+                return cached
+
+            # Search Qdrant
+            search_results = qdrant.query_points(
+                collection_name="rumi_content",
+                query=query_embedding,
+                limit=1,
+                search_params=CONTENT_SEARCH_PARAMS,
+                with_payload=POST_PAYLOAD_FIELDS,
+                with_vectors=False
+            ).points
+
+            if not search_results:
+                return f"Blog post not found: '{title}'"
+
+            # Get the best match
+            metadata = search_results[0].payload
 
         # Format output
-        output = f"**{metadata['title']}**\n\n"
-        output += f"Summary: {metadata['summary']}\n\n"
-        output += f"Category: {metadata['category']}\n"
-        output += f"Tags: {', '.join(metadata['tags'])}\n"
-        output += f"URL: {metadata['url']}\n\n"
-        output += "Note: For full content, please visit the URL above.\n"
-
+        output = "".join([
+            f"**{metadata['title']}**\n\n",
+            f"Summary: {metadata['summary']}\n\n",
+            f"Category: {metadata['category']}\n",
+            f"Tags: {', '.join(metadata['tags'])}\n",
+            f"URL: {metadata['url']}\n\n",
+            "Note: For full content, please visit the URL above.\n",
+        ])
+
+        if query_embedding is not None:
+            cache_result(qdrant, "get_blog_post_content", title, query_embedding, {}, output)
         return output
 
     except Exception as e:
-        import traceback
-        return f"Error getting blog post content: {str(e)}\n{traceback.format_exc()}"
+        return format_error("Error getting blog post content", e)
 
 
 def list_recent_posts(category: Optional[str] = None, limit: int = 5) -> str:
@@ -153,58 +161,54 @@ def list_recent_posts(category: Optional[str] = None, limit: int = 5) -> str:
     Returns:
         str: List of recent posts with titles, summaries, and tags
     """
-    import os
-    from qdrant_client import QdrantClient
-    from openai import OpenAI
-
     try:
-        # Connect to Qdrant
-        qdrant_host = os.getenv('QDRANT_HOST', 'localhost')
-        qdrant_port = int(os.getenv('QDRANT_PORT', '6333'))
-        qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
-
-        # Connect to OpenAI for embeddings
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        embedding_model = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
-
-        # Use a broad query to get diverse results
-        query = "blog posts" if not category else f"{category} blog posts"
-        response = openai_client.embeddings.create(input=query, model=embedding_model)
-        query_embedding = response.data[0].embedding
-
-        # Build filter
-        must_conditions = []
-        if category:
-            must_conditions.append({
-                "key": "category",
-                "match": {"value": category}
-            })
-
-        query_filter = {"must": must_conditions} if must_conditions else None
-
-        # Search Qdrant
-        search_results = qdrant.search(
-            collection_name="rumi_content",
-            query_vector=query_embedding,
-            limit=limit,
-            query_filter=query_filter
-        )
-
-        if not search_results:
+        # Shared Qdrant client (connections reused across calls)
+        qdrant = get_qdrant()
+
+        scroll_filter = category_filter(category)
+
+        # "Most recent" needs no similarity search: scroll in date order
+        recent_posts = scroll_recent_posts(qdrant, scroll_filter, limit)
+
+        if recent_posts is None:
+            # Older points lack published_ts: page through all payloads
+            # (no vectors, no embedding call) and sort by date instead.
+            # Each chunk carries its post's metadata, so keep one per URL.
+            posts_by_url = {}
+            offset = None
+            while True:
+                points, offset = qdrant.scroll(
+                    collection_name="rumi_content",
+                    scroll_filter=scroll_filter,
+                    limit=256,
+                    offset=offset,
+                    with_payload=["title", "url", "published", "summary", "tags"],
+                    with_vectors=False
+                )
+                for point in points:
+                    posts_by_url.setdefault(point.payload['url'], point.payload)
+                if offset is None:
+                    break
+
+            recent_posts = sorted(
+                posts_by_url.values(),
+                key=lambda post: published_timestamp(post['published']),
+                reverse=True
+            )[:limit]
+
+        if not recent_posts:
             return "No blog posts found."
 
         # Format results
         category_text = f"{category}-related " if category else ""
-        output = f"Recent {category_text}blog posts:\n\n"
+        parts = [f"Recent {category_text}blog posts:\n\n"]
 
-        for i, hit in enumerate(search_results, 1):
-            metadata = hit.payload
-            output += f"{i}. {metadata['title']} ({metadata['published'][:10]})\n"
-            output += f"   Summary: {metadata['summary']}\n"
-            output += f"   Tags: {', '.join(metadata['tags'][:3])}\n\n"
+        for i, metadata in enumerate(recent_posts, 1):
+            parts.append(f"{i}. {metadata['title']} ({metadata['published'][:10]})\n")
+            parts.append(f"   Summary: {metadata['summary']}\n")
+            parts.append(f"   Tags: {', '.join(metadata['tags'][:3])}\n\n")
 
-        return output
+        return "".join(parts)
 
     except Exception as e:
-        import traceback
-        return f"Error listing posts: {str(e)}\n{traceback.format_exc()}"
+        return format_error("Error listing posts", e)
@@ -0,0 +1,487 @@
+"""
+Shared runtime for the Letta tools in qdrant_tools.py.
+
+Letta runs a tool from its uploaded source code, outside this repository,
+so the tools can't import from src/. scripts/recreate_tools.py uploads
+this module's source followed by the tool function instead (Letta takes
+the last function in the source as the tool). Keep this module
+self-contained: stdlib, openai (and its httpx) and qdrant-client imports
+only.
+"""
+
+from array import array
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+
+import httpx
+from openai import OpenAI
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Direction,
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchText,
+    MatchValue,
+    OrderBy,
+    PointStruct,
+    QuantizationSearchParams,
+    Range,
+    SearchParams,
+    VectorParams,
+)
+
+logger = logging.getLogger(__name__)
+
+# Connection settings, read once (Letta passes them as tool env vars)
+QDRANT_HOST = os.getenv('QDRANT_HOST', 'localhost')
+QDRANT_PORT = int(os.getenv('QDRANT_PORT', '6333'))
+QDRANT_GRPC_PORT = int(os.getenv('QDRANT_GRPC_PORT', '6334'))
+QDRANT_PREFER_GRPC = os.getenv('QDRANT_PREFER_GRPC', 'true').lower() == 'true'
+EMBEDDING_MODEL = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+
+# Query embeddings persist here across tool runs (each run may be a new process)
+QUERY_CACHE_PATH = os.getenv(
+    'RUMI_QUERY_CACHE_PATH',
+    os.path.expanduser('~/.cache/rumi/query_embeddings.sqlite3')
+)
+
+# rumi_content keeps INT8-quantized vectors in RAM (see RumiQdrantClient.
+# create_collection); search those, then rescore the top hits with float32.
+# The tools ask for at most a handful of hits, so a smaller HNSW beam than
+# the default (hnsw_ef falls back to ef_construct, 128 as set in
+# create_collection) keeps recall while visiting fewer nodes.
+CONTENT_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=64,
+    exact=False,
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Payload fields the tools format; chunk text and chunk_id are never read
+POST_PAYLOAD_FIELDS = ["title", "url", "published", "category", "summary", "tags"]
+
+_client_lock = threading.Lock()
+# Caps concurrent embedding requests when Letta dispatches tools in parallel
+_embed_semaphore = threading.BoundedSemaphore(16)
+# (model, normalized query) -> embedding, for repeats within a process
+QUERY_MEMORY_CACHE_SIZE = 1024
+_query_embeddings: Dict[Tuple[str, str], List[float]] = {}
+_qdrant: Optional[QdrantClient] = None
+_openai: Optional[OpenAI] = None
+
+# Formatted tool results are reused for near-identical queries. The sync
+# script clears the cache after ingesting new posts (clear_result_cache);
+# the TTL only bounds staleness from changes made any other way.
+RESULT_CACHE_COLLECTION = "tool_response_cache"
+RESULT_CACHE_MIN_SCORE = 0.97
+RESULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Set once this process has seen the cache collection exist
+_result_cache_ready = False
+
+
+def get_qdrant() -> QdrantClient:
+    """Get the shared Qdrant client, creating it on first use.
+
+    Reusing one client keeps its connections alive between tool calls.
+    Uses gRPC by default, so query vectors travel as packed floats rather
+    than JSON. If QDRANT_GRPC_PORT (6334) isn't reachable, falls back to
+    REST on QDRANT_PORT; set QDRANT_PREFER_GRPC=false to skip the probe.
+    """
+    global _qdrant
+    if _qdrant is None:
+        with _client_lock:
+            if _qdrant is None:
+                client = QdrantClient(
+                    host=QDRANT_HOST,
+                    port=QDRANT_PORT,
+                    grpc_port=QDRANT_GRPC_PORT,
+                    prefer_grpc=QDRANT_PREFER_GRPC
+                )
+                if QDRANT_PREFER_GRPC:
+                    try:
+                        client.get_collections()
+                    except Exception as e:
+                        logger.warning(
+                            f"Qdrant gRPC port {QDRANT_GRPC_PORT} unreachable ({e}), using REST"
+                        )
+                        client.close()
+                        client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT)
+                _qdrant = client
+    return _qdrant
+
+
+def get_openai() -> OpenAI:
+    """Get the shared OpenAI client, creating it on first use."""
+    global _openai
+    if _openai is None:
+        with _client_lock:
+            if _openai is None:
+                _openai = OpenAI(
+                    api_key=os.getenv('OPENAI_API_KEY'),
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=32,
+                            max_keepalive_connections=16,
+                            keepalive_expiry=60
+                        ),
+                        timeout=httpx.Timeout(30.0, connect=5.0)
+                    )
+                )
+    return _openai
+
+
+def find_post_by_title(qdrant: QdrantClient, title: str) -> Optional[Dict]:
+    """Find a post by title text, without embedding or a vector search.
+
+    Tries the keyword index on 'title_norm' (exact title, case and
+    whitespace folded) first, then the full-text index on 'title'. Succeeds
+    when a stored title equals the given one (ignoring case), or when the
+    words match exactly one post.
+
+    Args:
+        qdrant: Qdrant client
+        title: Title, or distinctive words from it
+
+    Returns:
+        The post's payload, or None if there is no unambiguous match
+    """
+    # Same normalization as src/ingestion/blog.normalize_title
+    wanted = " ".join(title.split()).lower()
+
+    points, _ = qdrant.scroll(
+        collection_name="rumi_content",
+        scroll_filter=Filter(must=[
+            FieldCondition(key="title_norm", match=MatchValue(value=wanted))
+        ]),
+        limit=1,
+        with_payload=POST_PAYLOAD_FIELDS,
+        with_vectors=False
+    )
+    if points:
+        return points[0].payload
+
+    # Collect every matching chunk (paging to the end), so "one post
+    # matched" is only concluded when no other post matches too
+    title_filter = Filter(must=[
+        FieldCondition(key="title", match=MatchText(text=title))
+    ])
+    # Chunks of one post share its metadata; keep one payload per post
+    posts = {}
+    offset = None
+    while True:
+        points, offset = qdrant.scroll(
+            collection_name="rumi_content",
+            scroll_filter=title_filter,
+            limit=64,
+            offset=offset,
+            with_payload=POST_PAYLOAD_FIELDS,
+            with_vectors=False
+        )
+        for point in points:
+            posts.setdefault(point.payload['url'], point.payload)
+        if offset is None:
+            break
+
+    for post in posts.values():
+        if " ".join(post['title'].split()).lower() == wanted:
+            return post
+    if len(posts) == 1:
+        return next(iter(posts.values()))
+    return None
+
+
+def category_filter(category: Optional[str]) -> Optional[Filter]:
+    """Build the Qdrant filter for an optional category argument.
+
+    Args:
+        category: 'work', 'personal', or None for all posts
+
+    Returns:
+        Filter on the category payload field, or None
+    """
+    if not category:
+        return None
+    return Filter(must=[
+        FieldCondition(key="category", match=MatchValue(value=category))
+    ])
+
+
+def format_error(message: str, error: Exception) -> str:
+    """Format an exception as a tool result, with its traceback.
+
+    Must be called from inside the except block handling error.
+    """
+    return f"{message}: {error}\n{traceback.format_exc()}"
+
+
+def scroll_recent_posts(
+    qdrant: QdrantClient,
+    scroll_filter: Optional[Filter],
+    limit: int
+) -> Optional[List[Dict]]:
+    """Get the newest posts by scrolling in published_ts order.
+
+    Reads only the newest chunks instead of every point. Points stored
+    before published_ts was added are invisible to order_by, so this gives
+    up (returns None) rather than return a partial list when it finds
+    fewer than limit posts, or when the server lacks the range index.
+
+    Args:
+        qdrant: Qdrant client
+        scroll_filter: Optional payload filter (e.g. category_filter())
+        limit: Number of posts wanted
+
+    Returns:
+        Up to limit post payloads, newest first, or None to fall back to a
+        full scan
+    """
+    # Posts have a few chunks each; fetch enough chunks to cover limit posts
+    fetch = limit * 8
+    try:
+        points, _ = qdrant.scroll(
+            collection_name="rumi_content",
+            scroll_filter=scroll_filter,
+            limit=fetch,
+            order_by=OrderBy(key="published_ts", direction=Direction.DESC),
+            with_payload=POST_PAYLOAD_FIELDS,
+            with_vectors=False
+        )
+    except Exception:
+        return None
+
+    posts = {}
+    for point in points:
+        posts.setdefault(point.payload['url'], point.payload)
+        if len(posts) == limit:
+            return list(posts.values())
+    return None
+
+
+def published_timestamp(published: str) -> float:
+    """Parse a post's published date for sorting.
+
+    Args:
+        published: Date as stored from the feed (RFC 822 for RSS, ISO 8601
+            for Atom)
+
+    Returns:
+        POSIX timestamp, or 0.0 if the date can't be parsed
+    """
+    try:
+        return parsedate_to_datetime(published).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(published).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _open_query_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk query embedding cache, or None if unavailable."""
+    try:
+        os.makedirs(os.path.dirname(QUERY_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(QUERY_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "hash BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def embed_query(text: str) -> List[float]:
+    """Embed a search query, reusing earlier embeddings of the same query.
+
+    The cache key is the query normalized for case and whitespace (plus
+    the model), so "vLLM posts" and "vllm  posts" are looked up together,
+    but OpenAI is always sent the original text: the first spelling seen
+    is the one embedded. Hits are served from memory or the on-disk cache.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Embedding vector (do not modify; it is shared between callers)
+    """
+    normalized = " ".join(text.split()).lower()
+    memory_key = (EMBEDDING_MODEL, normalized)
+    embedding = _query_embeddings.get(memory_key)
+    if embedding is not None:
+        return embedding
+
+    key = hashlib.sha256(f"{EMBEDDING_MODEL}\0{normalized}".encode("utf-8")).digest()
+
+    conn = _open_query_cache()
+    try:
+        row = None
+        if conn is not None:
+            row = conn.execute(
+                "SELECT vector FROM embeddings WHERE hash = ?", (key,)
+            ).fetchone()
+
+        if row is not None:
+            vector = array("f")
+            vector.frombytes(row[0])
+            embedding = vector.tolist()
+        else:
+            with _embed_semaphore:
+                response = get_openai().embeddings.create(input=text, model=EMBEDDING_MODEL)
+            embedding = response.data[0].embedding
+
+            if conn is not None:
+                with conn:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO embeddings (hash, vector) VALUES (?, ?)",
+                        (key, array("f", embedding).tobytes())
+                    )
+    finally:
+        if conn is not None:
+            conn.close()
+
+    if len(_query_embeddings) >= QUERY_MEMORY_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _query_embeddings.pop(next(iter(_query_embeddings)), None)
+    _query_embeddings[memory_key] = embedding
+    return embedding
+
+
+def _result_cache_filter(tool: str, params: Dict[str, object]) -> Filter:
+    """Match cached results of the same tool, arguments and freshness."""
+    conditions = [FieldCondition(key="tool", match=MatchValue(value=tool))]
+    for name, value in params.items():
+        conditions.append(
+            FieldCondition(key=f"params.{name}", match=MatchValue(value=value))
+        )
+    conditions.append(
+        FieldCondition(
+            key="created_at",
+            range=Range(gte=time.time() - RESULT_CACHE_TTL_SECONDS)
+        )
+    )
+    return Filter(must=conditions)
+
+
+def _ensure_result_cache(qdrant: QdrantClient, vector_size: int):
+    """Create the result cache collection if needed (checked once per process)."""
+    global _result_cache_ready
+    if _result_cache_ready:
+        return
+    if not qdrant.collection_exists(RESULT_CACHE_COLLECTION):
+        qdrant.create_collection(
+            collection_name=RESULT_CACHE_COLLECTION,
+            vectors_config=VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE
+            )
+        )
+    _result_cache_ready = True
+
+
+def clear_result_cache(qdrant: QdrantClient):
+    """Drop every cached tool result (call after ingesting new content).
+
+    The collection is recreated on the next tool call.
+    """
+    global _result_cache_ready
+    qdrant.delete_collection(RESULT_CACHE_COLLECTION)
+    _result_cache_ready = False
+    logger.info(f"Cleared tool result cache ({RESULT_CACHE_COLLECTION})")
+
+
+def get_cached_result(
+    qdrant: QdrantClient,
+    tool: str,
+    query_embedding: List[float],
+    params: Dict[str, object]
+) -> Optional[str]:
+    """Look up a tool result cached for a semantically similar query.
+
+    Args:
+        qdrant: Qdrant client
+        tool: Tool name
+        query_embedding: Embedding of the current query
+        params: Other tool arguments (str/int values; must match exactly)
+
+    Returns:
+        The cached formatted result, or None on a miss
+    """
+    global _result_cache_ready
+    try:
+        _ensure_result_cache(qdrant, len(query_embedding))
+        hits = qdrant.query_points(
+            collection_name=RESULT_CACHE_COLLECTION,
+            query=query_embedding,
+            query_filter=_result_cache_filter(tool, params),
+            limit=1,
+            score_threshold=RESULT_CACHE_MIN_SCORE,
+            with_payload=["result"],
+            with_vectors=False
+        ).points
+    except Exception as e:
+        # Treated as a miss; re-check the collection next time (it may
+        # have been cleared by a sync)
+        _result_cache_ready = False
+        logger.warning(f"Tool result cache lookup failed: {e}")
+        return None
+    return hits[0].payload["result"] if hits else None
+
+
+def cache_result(
+    qdrant: QdrantClient,
+    tool: str,
+    query: str,
+    query_embedding: List[float],
+    params: Dict[str, object],
+    result: str
+):
+    """Store a formatted tool result for get_cached_result().
+
+    Failures are logged but not raised: the cache is an optimization only.
+    The upsert isn't waited on, so storing doesn't delay the tool's reply.
+
+    Args:
+        qdrant: Qdrant client
+        tool: Tool name
+        query: Query text (stored for debugging)
+        query_embedding: Embedding of the query
+        params: Other tool arguments (str/int values)
+        result: Formatted tool output
+    """
+    global _result_cache_ready
+    try:
+        _ensure_result_cache(qdrant, len(query_embedding))
+
+        # Same query and arguments -> same point, so repeats overwrite
+        point_id = str(uuid.uuid5(
+            uuid.NAMESPACE_DNS,
+            f"{tool}\0{' '.join(query.split()).lower()}\0{sorted(params.items())}"
+        ))
+        qdrant.upsert(
+            collection_name=RESULT_CACHE_COLLECTION,
+            points=[PointStruct(
+                id=point_id,
+                vector=query_embedding,
+                payload={
+                    "tool": tool,
+                    "query": query,
+                    "params": params,
+                    "result": result,
+                    "created_at": time.time()
+                }
+            )],
+            wait=False
+        )
+    except Exception as e:
+        _result_cache_ready = False
+        logger.warning(f"Failed to cache {tool} result: {e}")
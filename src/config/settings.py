@@ -52,6 +52,22 @@ class Settings(BaseSettings):
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
 
+    # Local embedding cache (SQLite); set to empty to disable
+    embedding_cache_path: Optional[str] = ".cache/embeddings.sqlite3"
+
+    # Local classification cache (SQLite); set to empty to disable
+    classification_cache_path: Optional[str] = ".cache/classifications.sqlite3"
+
+    # Classify posts with an obvious keyword majority without calling the
+    # LLM (keyword tags and first-sentence summary instead of generated ones)
+    keyword_classification: bool = False
+
+    # Local record of points known to exist in Qdrant (SQLite); set to empty to disable
+    point_cache_path: Optional[str] = ".cache/points.sqlite3"
+
+    # Last fetched copy of each RSS feed (for conditional GET); empty disables
+    feed_cache_dir: Optional[str] = ".cache/feeds"
+
     # DynamoDB (Task 1.1 - will create table then)
     dynamodb_state_table: str = "rumi_state"
 
@@ -4,25 +4,114 @@ Blog RSS feed parser and fetcher.
 Fetches and parses blog posts from RSS feeds.
 """
 
+import calendar
 import feedparser
-from typing import List, Dict
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
 from src.config.logger import get_logger
+from src.config.settings import settings
 
 logger = get_logger(__name__)
 
 
-def fetch_blog_posts(rss_url: str) -> List[Dict]:
+@lru_cache(maxsize=4096)
+def url_slug(url: str) -> str:
+    """
+    Get the last path segment of a post URL, used as its stable identifier.
+
+    Query strings, fragments and trailing slashes are ignored.
+
+    Args:
+        url: Post URL (e.g., "https://agamjn.com/detachment")
+
+    Returns:
+        URL slug (e.g., "detachment"); the host if the path is empty
+
+    Example:
+        >>> url_slug("https://agamjn.com/detachment/?utm_source=rss")
+        'detachment'
+    """
+    parts = urlsplit(url)
+    return parts.path.rstrip("/").rsplit("/", 1)[-1] or parts.netloc or url
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a post title for exact lookups (case and whitespace folded).
+
+    Must match the normalization in src/agents/tool_runtime.find_post_by_title.
+
+    Example:
+        >>> normalize_title("  On   Detachment ")
+        'on detachment'
+    """
+    return " ".join(title.split()).lower()
+
+
+def _feed_cache_path(rss_url: str) -> Optional[Path]:
+    """Path of the on-disk cache for a feed, or None if caching is disabled."""
+    if not settings.feed_cache_dir:
+        return None
+    name = hashlib.sha256(rss_url.encode("utf-8")).hexdigest()[:16]
+    return Path(settings.feed_cache_dir) / f"{name}.json"
+
+
+def _load_feed_cache(path: Optional[Path]) -> Optional[Dict]:
+    """Load a cached feed (etag, modified, posts), or None if unavailable."""
+    if path is None or not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable feed cache {path}: {e}")
+        return None
+
+
+def _save_feed_cache(path: Optional[Path], feed, posts: List[Dict]):
+    """Store parsed posts with the feed's ETag/Last-Modified validators."""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "etag": feed.get("etag"),
+            "modified": feed.get("modified"),
+            "posts": posts,
+        }), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not write feed cache {path}: {e}")
+
+
+def _published_timestamp(entry) -> float:
+    """POSIX timestamp of an entry's publication date, or 0.0 if it has none."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    return float(calendar.timegm(parsed)) if parsed else 0.0
+
+
+def fetch_blog_posts(rss_url: str, force_refresh: bool = False) -> List[Dict]:
     """
     Fetch and parse blog posts from an RSS feed.
 
+    Uses a conditional GET (ETag / If-Modified-Since) against the last
+    fetch cached under settings.feed_cache_dir; if the server answers
+    304 Not Modified, the cached posts are returned without downloading
+    or parsing the feed again.
+
     Args:
         rss_url: URL of the RSS feed (e.g., "https://agamjn.com/feed")
+        force_refresh: Ignore the cached copy and download the full feed
 
     Returns:
         List of dicts, each containing:
             - title: Post title
             - content: Post content (HTML)
             - published: Publication date (ISO format string)
+            - published_ts: Publication date as a POSIX timestamp (0.0 if unknown)
             - url: URL to the post
             - summary: Short summary if available
 
@@ -34,8 +123,21 @@ def fetch_blog_posts(rss_url: str) -> List[Dict]:
     logger.info(f"Fetching RSS feed from {rss_url}")
 
     try:
-        # Parse the RSS feed
-        feed = feedparser.parse(rss_url)
+        cache_path = _feed_cache_path(rss_url)
+        cached = None if force_refresh else _load_feed_cache(cache_path)
+        if cached and any("published_ts" not in post for post in cached["posts"]):
+            cached = None  # Written before published_ts existed; refetch
+
+        # Parse the RSS feed (conditional GET if we have a cached copy)
+        feed = feedparser.parse(
+            rss_url,
+            etag=cached.get("etag") if cached else None,
+            modified=cached.get("modified") if cached else None
+        )
+
+        if cached and feed.get("status") == 304:
+            logger.info(f"Feed not modified, using {len(cached['posts'])} cached posts")
+            return cached["posts"]
 
         # Check if feed was fetched successfully
         if feed.bozo:  # bozo=1 means there was an error
@@ -43,29 +145,77 @@ def fetch_blog_posts(rss_url: str) -> List[Dict]:
 
         posts = []
         for entry in feed.entries:
+            # Plain dict view: lookups skip FeedParserDict's key mapping
+            fields = dict(entry)
+
             # Extract content (try different fields, some feeds use different names)
-            content = ""
-            if hasattr(entry, "content"):
-                content = entry.content[0].value  # content is a list
-            elif hasattr(entry, "description"):
-                content = entry.description
-            elif hasattr(entry, "summary"):
-                content = entry.summary
+            content_list = fields.get("content")  # content is a list
+            content = (
+                (content_list[0].get("value") if content_list else None)
+                or fields.get("description")
+                or fields.get("summary", "")
+            )
 
             # Build structured post dict
             post = {
-                "title": entry.get("title", "Untitled"),
+                "title": fields.get("title", "Untitled"),
                 "content": content,
-                "published": entry.get("published", ""),
-                "url": entry.get("link", ""),
-                "summary": entry.get("summary", ""),
+                "published": fields.get("published", ""),
+                "published_ts": _published_timestamp(fields),
+                "url": fields.get("link", ""),
+                "summary": fields.get("summary", ""),
             }
 
             posts.append(post)
 
         logger.info(f"Successfully fetched {len(posts)} posts from RSS feed")
+        _save_feed_cache(cache_path, feed, posts)
         return posts
 
     except Exception as e:
         logger.error(f"Failed to fetch RSS feed: {str(e)}")
         raise
+
+
+def fetch_blog_posts_many(
+    rss_urls: List[str],
+    force_refresh: bool = False,
+    max_workers: int = 16
+) -> Dict[str, List[Dict]]:
+    """
+    Fetch several RSS feeds concurrently.
+
+    Each feed is fetched with fetch_blog_posts() (including its conditional
+    GET); the downloads overlap instead of running one after another.
+
+    Args:
+        rss_urls: Feed URLs
+        force_refresh: Ignore cached copies and download every feed
+        max_workers: Maximum number of feeds fetched at once
+
+    Returns:
+        Dict mapping each feed URL to its posts. Feeds that fail to fetch
+        are logged and omitted.
+
+    Example:
+        >>> feeds = fetch_blog_posts_many(["https://agamjn.com/feed", "https://example.com/rss"])
+        >>> sum(len(posts) for posts in feeds.values())
+    """
+    rss_urls = list(dict.fromkeys(rss_urls))  # Drop duplicates, keep order
+    if not rss_urls:
+        return {}
+
+    def fetch(rss_url: str) -> Optional[List[Dict]]:
+        try:
+            return fetch_blog_posts(rss_url, force_refresh=force_refresh)
+        except Exception:
+            return None  # Already logged by fetch_blog_posts
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(rss_urls))) as executor:
+        results = list(executor.map(fetch, rss_urls))
+
+    return {
+        rss_url: posts
+        for rss_url, posts in zip(rss_urls, results)
+        if posts is not None
+    }
@@ -4,15 +4,144 @@ Content classification using OpenAI API.
 Classifies content as work/personal and extracts metadata.
 """
 
+import hashlib
+import html
 import json
-from typing import Dict
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
 from openai import OpenAI
+import tiktoken
 
 from src.config.settings import settings
 from src.config.logger import get_logger
+from src.storage.classification_cache import ClassificationCache
 
 logger = get_logger(__name__)
 
+# Classification only needs the gist: markup adds tokens but no signal, and
+# the opening ~2k tokens say what a post is about. The character cap is a
+# cheap first cut so huge posts are never tokenized in full.
+MAX_CONTENT_TOKENS = 2000
+MAX_CONTENT_CHARS = 8 * MAX_CONTENT_TOKENS
+
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Keywords that mark a post's category on their own (matched as whole
+# words, case-insensitively). With settings.keyword_classification on,
+# posts that clearly hit one side are classified without an API call;
+# anything ambiguous goes to the LLM. Only specific terms: generic words
+# (startup, latency, ego, ...) appear in posts of either category.
+CATEGORY_KEYWORDS = {
+    "work": [
+        "vllm", "tensorfuse", "fastpull", "kubernetes", "gpu", "inference",
+        "llm", "rag", "reranker", "embeddings", "fine-tuning", "serverless",
+    ],
+    "personal": [
+        "advaita", "consciousness", "detachment", "meditation", "vedanta",
+        "spirituality", "mental health", "self-inquiry",
+    ],
+}
+# A shortcut needs this many distinct keywords for the winning category,
+# and at least MIN_KEYWORD_MARGIN times as many as the other one
+MIN_KEYWORD_HITS = 3
+MIN_KEYWORD_MARGIN = 3
+
+_KEYWORD_CATEGORY = {
+    keyword: category
+    for category, keywords in CATEGORY_KEYWORDS.items()
+    for keyword in keywords
+}
+_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(re.escape(k) for k in _KEYWORD_CATEGORY) + r")\b",
+    re.IGNORECASE
+)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Tokenizer of the classification model (gpt-4o family)."""
+    return tiktoken.get_encoding("o200k_base")
+
+
+def _prepare_content(content: str) -> str:
+    """Reduce HTML content to plain text for the classification prompt.
+
+    Drops script/style blocks and tags, decodes entities, collapses
+    whitespace and truncates to MAX_CONTENT_TOKENS.
+    """
+    text = _SCRIPT_STYLE_RE.sub(" ", content)
+    text = _TAG_RE.sub(" ", text)
+    text = html.unescape(text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()[:MAX_CONTENT_CHARS]
+
+    tokens = _get_encoding().encode(text, disallowed_special=())
+    if len(tokens) > MAX_CONTENT_TOKENS:
+        text = _get_encoding().decode(tokens[:MAX_CONTENT_TOKENS])
+    return text
+
+
+def _cheap_classify(text: str) -> Optional[Dict]:
+    """Classify obvious posts from keywords alone, without the LLM.
+
+    Args:
+        text: Plain post text (from _prepare_content())
+
+    Returns:
+        Classification dict like classify_content(), or None if the
+        keywords don't clearly favour one category
+    """
+    matches = Counter(m.group(1).lower() for m in _KEYWORD_RE.finditer(text))
+    distinct = {category: [] for category in CATEGORY_KEYWORDS}
+    for keyword, _ in matches.most_common():
+        distinct[_KEYWORD_CATEGORY[keyword]].append(keyword)
+
+    ranked = sorted(distinct.items(), key=lambda item: len(item[1]), reverse=True)
+    (category, keywords), (_, other) = ranked[0], ranked[1]
+    if len(keywords) < MIN_KEYWORD_HITS:
+        return None
+    if len(keywords) < MIN_KEYWORD_MARGIN * len(other):
+        return None
+
+    # Summary: the opening sentence, kept under 150 characters
+    summary = _SENTENCE_END_RE.split(text, maxsplit=1)[0]
+    if len(summary) > 150:
+        summary = summary[:147].rsplit(" ", 1)[0] + "..."
+
+    return {
+        "category": category,
+        "tags": keywords[:7],  # Most frequent first
+        "summary": summary,
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """Shared OpenAI client, so consecutive calls reuse its connection pool."""
+    return OpenAI(api_key=settings.openai_api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_cache() -> Optional[ClassificationCache]:
+    """Shared classification cache, or None if disabled in settings."""
+    if not settings.classification_cache_path:
+        return None
+    return ClassificationCache(settings.classification_cache_path)
+
+
+def _cache_key(content: str, platform: str, title: str, date: str) -> str:
+    """Hash everything the classification depends on into a cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (settings.openai_model, platform, title, date, content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 def classify_content(content: str, platform: str, title: str = "", date: str = "") -> Dict:
     """
@@ -39,10 +168,29 @@ def classify_content(content: str, platform: str, title: str = "", date: str = "
         >>> print(classification['category'])  # "work"
         >>> print(classification['tags'])  # ["ml", "optimization", "reranker"]
     """
-    logger.info(f"Classifying content from {platform}: {title[:50]}...")
+    logger.info("Classifying content from %s: %s...", platform, title[:50])
+
+    # Send plain text, not HTML (markup inflates tokens without helping)
+    content = _prepare_content(content)
 
-    # Note: gpt-4o-mini supports 128k tokens, so no need to truncate
-    # Your blog posts (4-9KB) are well within limits (~1-2k tokens each)
+    # Skip the API call when keywords settle it (opt-in: the keyword tags
+    # and summary are cruder than the LLM's)
+    result = _cheap_classify(content) if settings.keyword_classification else None
+    if result is not None:
+        logger.info(
+            "Classified by keywords: category=%s, tags=%s",
+            result['category'], result['tags']
+        )
+        return result
+
+    # Unchanged posts reuse their earlier classification
+    cache = _get_cache()
+    cache_key = _cache_key(content, platform, title, date)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Classification cache hit: category=%s", cached.get('category'))
+            return cached
 
     # Build the classification instructions
     instructions = """
@@ -87,8 +235,7 @@ Analyze this content and return the classification as JSON.
 """
 
     try:
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = _get_client()
 
         # Call the responses API
         response = client.responses.create(
@@ -102,17 +249,54 @@ Analyze this content and return the classification as JSON.
         result = json.loads(response.output_text)
 
         logger.info(
-            f"Classification complete: category={result.get('category')}, "
-            f"tags={len(result.get('tags', []))} tags"
+            "Classification complete: category=%s, tags=%d tags",
+            result.get('category'), len(result.get('tags', []))
         )
 
+        if cache is not None:
+            cache.put(cache_key, result)
         return result
 
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON response: {e}")
-        logger.debug(f"Raw response: {response.output_text}")
+        logger.error("Failed to parse JSON response: %s", e)
+        logger.debug("Raw response: %s", response.output_text)
         raise ValueError(f"Invalid JSON response from OpenAI: {e}")
 
     except Exception as e:
-        logger.error(f"Classification failed: {str(e)}")
+        logger.error("Classification failed: %s", e)
         raise
+
+
+def classify_contents(items: List[Dict], max_workers: int = 8) -> List[Union[Dict, Exception]]:
+    """
+    Classify several pieces of content concurrently.
+
+    Each item is an independent API call, so up to max_workers run at once
+    instead of one after another.
+
+    Args:
+        items: Dicts of classify_content() keyword arguments
+            (content, platform, and optionally title and date)
+        max_workers: Maximum number of concurrent API calls
+
+    Returns:
+        One entry per item, in order: the classification dict, or the
+        exception raised while classifying that item
+
+    Example:
+        >>> results = classify_contents([
+        ...     {"content": post["content"], "platform": "blog", "title": post["title"]}
+        ...     for post in posts
+        ... ])
+    """
+    if not items:
+        return []
+
+    def classify(item: Dict) -> Union[Dict, Exception]:
+        try:
+            return classify_content(**item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(classify, items))
@@ -12,21 +12,57 @@ Why chunking?
 - "Teaching #2" can be retrieved directly, not the whole post
 """
 
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import tiktoken
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# tiktoken threads for batch tokenization (its Rust core releases the GIL)
+TOKENIZER_THREADS = 8
+
+# Separators, from coarsest to finest
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_LINE_RE = re.compile(r'\n+')  # Headings, list items
+# Sentence ends, except after these abbreviations and inside "..."
+_ABBREVIATIONS = (
+    "Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "Sr.", "Jr.", "St.", "vs.",
+    "e.g.", "i.e.", "Inc.", "Ltd.", "Co.", "No.", "Fig.",
+)
+# Python lookbehinds must be fixed-width, hence one per abbreviation
+_SENTENCE_RE = re.compile(
+    "".join(rf"(?<!\b{re.escape(a)})" for a in _ABBREVIATIONS)
+    + r'(?<!\.\.)(?<=[.!?])\s+'
+)
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """Get the tokenizer for a model, loading it only once per process.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        The model's encoding (cl100k_base if tiktoken doesn't know the model)
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class TextChunker:
     """Smart text chunking for long documents.
 
     Strategy:
     1. Try to chunk by paragraphs (double newlines)
-    2. If paragraph too long, chunk by sentences
-    3. Add overlap between chunks to preserve context
+    2. If paragraph too long, chunk by lines (headings, list items), then
+       by sentences
+    3. Add overlap (whole trailing pieces or sentences) between chunks to
+       preserve context
 
     Example:
         >>> chunker = TextChunker(max_tokens=1000, overlap_tokens=100)
@@ -51,11 +87,10 @@ class TextChunker:
         self.max_tokens = max_tokens
         self.overlap_tokens = overlap_tokens
 
-        # Token encoder
-        try:
-            self.encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+        # Token encoder (shared between instances)
+        self.encoding = get_encoding(model)
+        # Cost of the blank line that joins pieces within a chunk
+        self.separator_tokens = len(self.encoding.encode_ordinary("\n\n"))
 
         logger.info(
             f"TextChunker initialized: max_tokens={max_tokens}, "
@@ -63,14 +98,19 @@ class TextChunker:
         )
 
     def count_tokens(self, text: str) -> int:
-        """Count tokens in text."""
-        return len(self.encoding.encode(text))
+        """Count tokens in text (special tokens are counted as plain text)."""
+        return len(self.encoding.encode_ordinary(text))
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts in one tokenizer call (in parallel)."""
+        return [len(tokens) for tokens in self._encode_batch(texts)]
 
     def chunk_text(
         self,
         text: str,
         doc_id: str,
-        metadata: Dict = None
+        metadata: Dict = None,
+        token_count: Optional[int] = None
     ) -> List[Dict]:
         """Chunk text into smaller pieces with metadata.
 
@@ -78,6 +118,8 @@ class TextChunker:
             text: Full text to chunk
             doc_id: Parent document ID (e.g., "blog:post_123")
             metadata: Additional metadata to attach to each chunk
+            token_count: Token count of text, if the caller already has it
+                (saves re-tokenizing the whole document)
 
         Returns:
             List of chunk dicts with keys:
@@ -90,7 +132,8 @@ class TextChunker:
             - metadata: Additional metadata
         """
         metadata = metadata or {}
-        token_count = self.count_tokens(text)
+        if token_count is None:
+            token_count = self._count_tokens_up_to_limit(text)
 
         # If short enough, return as single chunk
         if token_count <= self.max_tokens:
@@ -109,7 +152,7 @@ class TextChunker:
 
         # Need to chunk
         logger.info(
-            f"Document {doc_id} needs chunking ({token_count} tokens > "
+            f"Document {doc_id} needs chunking ({token_count}+ tokens > "
             f"{self.max_tokens} limit)"
         )
 
@@ -124,24 +167,104 @@ class TextChunker:
 
         return chunks
 
+    def _count_tokens_up_to_limit(self, text: str) -> int:
+        """Count tokens, stopping early once text is known to exceed max_tokens.
+
+        Only a prefix of long text is tokenized: if the prefix alone is over
+        the limit, the document gets chunked and its exact total is never
+        needed.
+
+        Returns:
+            Exact token count if it is within max_tokens, otherwise a count
+            (of a prefix) that is already above it
+        """
+        # Tokens average ~4 characters; 8 leaves room for unusual text
+        prefix = text[:self.max_tokens * 8]
+        token_count = self.count_tokens(prefix)
+        if len(prefix) == len(text) or token_count > self.max_tokens:
+            return token_count
+        return self.count_tokens(text)
+
+    @staticmethod
+    def _split(pattern: re.Pattern, text: str) -> List[str]:
+        """Split text on a separator pattern, dropping empty pieces."""
+        return [piece for piece in map(str.strip, pattern.split(text)) if piece]
+
     def _split_by_paragraphs(self, text: str) -> List[str]:
-        """Split text by paragraphs (double newlines).
+        """Split text by paragraphs (double newlines)."""
+        return self._split(_PARAGRAPH_RE, text)
+
+    def _encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Tokenize many texts in one tokenizer call (in parallel)."""
+        if not texts:
+            return []
+        return self.encoding.encode_ordinary_batch(
+            texts, num_threads=min(TOKENIZER_THREADS, len(texts))
+        )
 
-        Falls back to sentences if paragraphs are too long.
+    def _split_oversized(self, paragraph: str) -> Tuple[List[str], List[List[int]]]:
+        """Split a paragraph that exceeds max_tokens into smaller pieces.
+
+        Splits by lines first (headings, list items); lines that are still
+        too long are split by sentences.
+
+        Returns:
+            Pieces in order, and the token ids of each
         """
-        # Split by double newlines (paragraph breaks)
-        paragraphs = re.split(r'\n\s*\n', text)
+        lines = self._split(_LINE_RE, paragraph)
+
+        pieces, piece_ids = [], []
+        for line, ids in zip(lines, self._encode_batch(lines)):
+            if len(ids) > self.max_tokens:
+                sentences = self._split(_SENTENCE_RE, line)
+                pieces.extend(sentences)
+                piece_ids.extend(self._encode_batch(sentences))
+            else:
+                pieces.append(line)
+                piece_ids.append(ids)
+        return pieces, piece_ids
+
+    def _overlap_tail(self, chunk: List[Tuple[str, List[int]]]) -> List[Tuple[str, List[int]]]:
+        """Pick the end of a chunk to repeat at the start of the next one.
 
-        # Clean up
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+        Takes whole trailing pieces that fit in overlap_tokens. If the last
+        piece alone is too long, takes its trailing sentences instead, so
+        the overlap never starts mid-word or mid-sentence.
 
-        return paragraphs
+        Args:
+            chunk: (text, token ids) pieces of the finished chunk
 
-    def _split_by_sentences(self, text: str) -> List[str]:
-        """Split text by sentences (fallback for long paragraphs)."""
-        # Simple sentence splitting (can be improved with nltk)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        Returns:
+            (text, token ids) pieces for the overlap (may be empty)
+        """
+        if not self.overlap_tokens or not chunk:
+            return []
+
+        tail = []
+        tokens = 0
+        for piece, ids in reversed(chunk):
+            cost = len(ids) + (self.separator_tokens if tail else 0)
+            if tokens + cost > self.overlap_tokens:
+                break
+            tail.append((piece, ids))
+            tokens += cost
+        if tail:
+            return tail[::-1]
+
+        sentences = self._split(_SENTENCE_RE, chunk[-1][0])
+        if len(sentences) < 2:
+            return []
+        kept = []
+        tokens = 0
+        for sentence, ids in reversed(list(zip(sentences, self._encode_batch(sentences)))):
+            if tokens + len(ids) + 1 > self.overlap_tokens:  # +1: joining space
+                break
+            kept.append(sentence)
+            tokens += len(ids) + 1
+        if not kept:
+            return []
+        text = " ".join(kept[::-1])
+        return [(text, self.encoding.encode_ordinary(text))]
 
     def _create_chunks(
         self,
@@ -149,63 +272,61 @@ class TextChunker:
         doc_id: str,
         metadata: Dict
     ) -> List[Dict]:
-        """Create chunks from paragraphs with overlap."""
-        chunks = []
-        current_chunk = []
-        current_tokens = 0
-
-        for para in paragraphs:
-            para_tokens = self.count_tokens(para)
-
-            # If single paragraph exceeds limit, split by sentences
-            if para_tokens > self.max_tokens:
-                logger.warning(
-                    f"Paragraph too long ({para_tokens} tokens), splitting by sentences"
-                )
-                sentences = self._split_by_sentences(para)
-
-                # Recursively handle sentences
-                for sentence in sentences:
-                    sent_tokens = self.count_tokens(sentence)
-
-                    if current_tokens + sent_tokens > self.max_tokens:
-                        # Finalize current chunk
-                        if current_chunk:
-                            chunks.append({
-                                "text": "\n\n".join(current_chunk),
-                                "tokens": current_tokens
-                            })
-
-                        # Start new chunk with overlap
-                        current_chunk = [sentence]
-                        current_tokens = sent_tokens
-                    else:
-                        current_chunk.append(sentence)
-                        current_tokens += sent_tokens
-
-            # Normal paragraph handling
-            elif current_tokens + para_tokens > self.max_tokens:
-                # Finalize current chunk
-                if current_chunk:
-                    chunks.append({
-                        "text": "\n\n".join(current_chunk),
-                        "tokens": current_tokens
-                    })
-
-                # Start new chunk
-                current_chunk = [para]
-                current_tokens = para_tokens
+        """Create chunks from paragraphs with overlap.
 
-            else:
-                current_chunk.append(para)
-                current_tokens += para_tokens
+        Pieces are joined with blank lines, and the separators count toward
+        max_tokens. Each chunk after the first starts with whole trailing
+        pieces (or sentences) of the previous one, up to overlap_tokens.
+        Token ids are kept alongside the text, so sizes are tracked without
+        re-tokenizing.
+        """
+        chunks = []
+        current = []  # (text, token ids) pieces of the chunk being built
+        current_tokens = 0  # Their tokens, plus separators between them
+        has_new_text = False  # Whether current is more than overlap
+
+        def pieces():
+            """Yield (text, token ids), splitting oversized paragraphs."""
+            for para, ids in zip(paragraphs, self._encode_batch(paragraphs)):
+                if len(ids) > self.max_tokens:
+                    logger.warning(
+                        f"Paragraph too long ({len(ids)} tokens), splitting by lines/sentences"
+                    )
+                    yield from zip(*self._split_oversized(para))
+                else:
+                    yield para, ids
+
+        def size(chunk: List[Tuple[str, List[int]]]) -> int:
+            return sum(len(ids) for _, ids in chunk) + self.separator_tokens * max(len(chunk) - 1, 0)
+
+        for piece, ids in pieces():
+            added = len(ids) + (self.separator_tokens if current else 0)
+            if current and current_tokens + added > self.max_tokens:
+                if has_new_text:
+                    # Finalize current chunk
+                    chunks.append({"text": "\n\n".join(text for text, _ in current)})
+
+                    # Start new chunk with the previous chunk's tail
+                    current = self._overlap_tail(current)
+                    current_tokens = size(current)
+                    has_new_text = False
+
+                if current and current_tokens + self.separator_tokens + len(ids) > self.max_tokens:
+                    # No room for the overlap next to this piece
+                    current = []
+                    current_tokens = 0
+
+            current_tokens += len(ids) + (self.separator_tokens if current else 0)
+            current.append((piece, ids))
+            has_new_text = True
 
         # Add final chunk
-        if current_chunk:
-            chunks.append({
-                "text": "\n\n".join(current_chunk),
-                "tokens": current_tokens
-            })
+        if has_new_text:
+            chunks.append({"text": "\n\n".join(text for text, _ in current)})
+
+        # Exact counts of the joined text, in one batched call
+        for chunk, tokens in zip(chunks, self.count_tokens_batch([c["text"] for c in chunks])):
+            chunk["tokens"] = tokens
 
         # Add metadata to each chunk
         total_chunks = len(chunks)
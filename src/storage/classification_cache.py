@@ -0,0 +1,79 @@
+"""
+Local classification cache backed by SQLite.
+
+Classifications are keyed by a hash of the model and the post's content
+(and context), so re-ingesting a feed only sends new or changed posts to
+the classifier. Entries expire after a TTL so prompt or model drift is
+eventually picked up.
+"""
+
+from typing import Dict, Optional
+import json
+import logging
+import time
+
+from src.storage.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+class ClassificationCache:
+    """Persistent key -> classification cache with a TTL.
+
+    Safe to share between threads.
+
+    Example:
+        >>> cache = ClassificationCache(".cache/classifications.sqlite3")
+        >>> cache.put("3f2a...", {"category": "work", "tags": [], "summary": ""})
+        >>> cache.get("3f2a...")
+        {'category': 'work', 'tags': [], 'summary': ''}
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 30 * 24 * 60 * 60):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            ttl_seconds: Age after which an entry is ignored (default: 30 days)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._store = SQLiteStore(
+            path,
+            "CREATE TABLE IF NOT EXISTS classifications ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+        logger.info(f"ClassificationCache opened at {path}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a classification.
+
+        Args:
+            key: Cache key (see classifier._cache_key)
+
+        Returns:
+            The cached classification, or None if missing or expired
+        """
+        rows = self._store.query(
+            "SELECT result FROM classifications WHERE key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl_seconds)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def put(self, key: str, result: Dict):
+        """Store a classification, replacing any earlier one for the key.
+
+        Args:
+            key: Cache key
+            result: Classification dict
+        """
+        self._store.write(
+            "INSERT OR REPLACE INTO classifications (key, result, created_at) "
+            "VALUES (?, ?, ?)",
+            (key, json.dumps(result), time.time())
+        )
+
+    def close(self):
+        """Close the database connection."""
+        self._store.close()
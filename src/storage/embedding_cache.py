@@ -0,0 +1,101 @@
+"""
+Local embedding cache backed by SQLite.
+
+Embeddings are keyed by a hash of (model, text), so unchanged content is
+never sent to OpenAI twice - even if the Qdrant collection is rebuilt or
+a post's URL changes.
+
+Vectors are stored as float32 bytes (6 KB per 1536-dim embedding).
+"""
+
+from array import array
+from typing import List, Optional
+import hashlib
+import logging
+
+from src.storage.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent (model, text) -> embedding cache.
+
+    Safe to share between threads.
+
+    Example:
+        >>> cache = EmbeddingCache(".cache/embeddings.sqlite3")
+        >>> cache.put_many("text-embedding-3-small", ["hello"], [[0.1, 0.2]])
+        >>> cache.get_many("text-embedding-3-small", ["hello", "bye"])
+        [[0.1..., 0.2...], None]
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+        """
+        self.path = path
+        self._store = SQLiteStore(
+            path,
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "hash BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+
+        logger.info(f"EmbeddingCache opened at {path}")
+
+    @staticmethod
+    def _key(model: str, text: str) -> bytes:
+        """Hash a (model, text) pair into a cache key."""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Look up embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Input texts
+
+        Returns:
+            Embedding for each text, or None where it isn't cached
+        """
+        keys = [self._key(model, text) for text in texts]
+
+        found = dict(self._store.query_in(
+            "SELECT hash, vector FROM embeddings WHERE hash IN ({placeholders})",
+            keys
+        ))
+
+        results = []
+        for key in keys:
+            blob = found.get(key)
+            if blob is None:
+                results.append(None)
+            else:
+                vector = array("f")
+                vector.frombytes(blob)
+                results.append(vector.tolist())
+        return results
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]):
+        """Store embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Input texts
+            embeddings: Embedding for each text
+        """
+        rows = [
+            (self._key(model, text), array("f", embedding).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+
+        self._store.write_many(
+            "INSERT OR IGNORE INTO embeddings (hash, vector) VALUES (?, ?)",
+            rows
+        )
+
+    def close(self):
+        """Close the database connection."""
+        self._store.close()
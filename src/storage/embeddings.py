@@ -10,16 +10,37 @@ This enables semantic search in Qdrant.
 Cost: ~$0.02 per 1M tokens (about $0.00002 per blog post)
 """
 
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
-from typing import List, Dict
+from typing import List, Dict, Optional
+import base64
 import logging
-import tiktoken
 
 from src.config.settings import settings
 from src.storage.chunking import TextChunker
+from src.storage.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
+# USD per 1M input tokens
+EMBEDDING_PRICES = {
+    "text-embedding-3-small": 0.02,
+    "text-embedding-3-large": 0.13,
+    "text-embedding-ada-002": 0.10,
+}
+
+# OpenAI limits per embeddings request
+MAX_REQUEST_INPUTS = 2048
+MAX_REQUEST_TOKENS = 300_000
+
+
+def _decode_embedding(data: str) -> List[float]:
+    """Decode a base64 embedding (little-endian float32) into a list of floats."""
+    vector = array("f")
+    vector.frombytes(base64.b64decode(data))
+    return vector.tolist()
+
 
 class EmbeddingGenerator:
     """Generate embeddings using OpenAI API.
@@ -37,7 +58,7 @@ class EmbeddingGenerator:
         1536
     """
 
-    def __init__(self, model: str = "text-embedding-3-small"):
+    def __init__(self, model: str = "text-embedding-3-small", use_cache: bool = True):
         """Initialize the embedding generator.
 
         Args:
@@ -45,20 +66,24 @@ class EmbeddingGenerator:
                 - text-embedding-3-small: 1536 dims, $0.02/1M tokens (recommended)
                 - text-embedding-3-large: 3072 dims, $0.13/1M tokens (overkill)
                 - text-embedding-ada-002: 1536 dims, deprecated
+            use_cache: Reuse embeddings of previously seen text from the
+                local cache at settings.embedding_cache_path
         """
         self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = model
+
+        if model not in EMBEDDING_PRICES:
+            logger.warning(f"No price known for {model}, estimating costs at text-embedding-3-small rates")
+        self.price_per_token = EMBEDDING_PRICES.get(model, EMBEDDING_PRICES["text-embedding-3-small"]) / 1_000_000
         self.dimensions = 1536  # text-embedding-3-small output size
 
-        # For token counting (cost estimation)
-        try:
-            self.encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            # Fallback if model not recognized
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+        # Chunker for long documents (also does all token counting)
+        self.chunker = TextChunker(max_tokens=6000, overlap_tokens=200, model=model)
 
-        # Chunker for long documents
-        self.chunker = TextChunker(max_tokens=6000, overlap_tokens=200)
+        # Cache of already-embedded text (skips re-embedding unchanged content)
+        self.cache = None
+        if use_cache and settings.embedding_cache_path:
+            self.cache = EmbeddingCache(settings.embedding_cache_path)
 
         logger.info(f"EmbeddingGenerator initialized with model: {model}")
 
@@ -71,10 +96,24 @@ class EmbeddingGenerator:
         Returns:
             Number of tokens
         """
-        return len(self.encoding.encode(text))
+        return self.chunker.count_tokens(text)
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts at once.
+
+        Uses tiktoken's batch encoder, which tokenizes in parallel threads
+        and skips the special-token scan.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Number of tokens for each text, in input order
+        """
+        return self.chunker.count_tokens_batch(texts)
 
     def estimate_cost(self, token_count: int) -> float:
-        """Estimate cost in USD for given token count.
+        """Estimate cost in USD for given token count (at this model's price).
 
         Args:
             token_count: Number of tokens
@@ -82,11 +121,9 @@ class EmbeddingGenerator:
         Returns:
             Estimated cost in USD
         """
-        # text-embedding-3-small pricing: $0.02 per 1M tokens
-        cost_per_million = 0.02
-        return (token_count / 1_000_000) * cost_per_million
+        return token_count * self.price_per_token
 
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(self, text: str, token_count: Optional[int] = None) -> List[float]:
         """Generate embedding for a single text.
 
         This converts text into a 1536-dimensional vector that captures
@@ -94,6 +131,8 @@ class EmbeddingGenerator:
 
         Args:
             text: Input text to embed (up to ~8000 tokens)
+            token_count: Token count of text, if already known (only used
+                for logging; saves re-tokenizing)
 
         Returns:
             List of 1536 floats representing the embedding vector
@@ -106,21 +145,22 @@ class EmbeddingGenerator:
             >>> len(embedding)
             1536
         """
-        try:
-            # Count tokens for logging
-            token_count = self.count_tokens(text)
-            cost = self.estimate_cost(token_count)
+        if self.cache is not None:
+            cached = self.cache.get_many(self.model, [text])[0]
+            if cached is not None:
+                logger.info(f"Reusing cached embedding ({len(text)} chars)")
+                return cached
 
-            logger.info(f"Generating embedding for text ({len(text)} chars, {token_count} tokens, ${cost:.6f})")
+        try:
+            # Tokens are only counted for this log line
+            if logger.isEnabledFor(logging.INFO):
+                if token_count is None:
+                    token_count = self.count_tokens(text)
+                cost = self.estimate_cost(token_count)
+                logger.info(f"Generating embedding for text ({len(text)} chars, {token_count} tokens, ${cost:.6f})")
 
             # Call OpenAI API
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=text,
-                encoding_format="float"  # Return as list of floats
-            )
-
-            embedding = response.data[0].embedding
+            embedding = self._embed_request([text])[0]
 
             # Validate dimensions
             if len(embedding) != self.dimensions:
@@ -129,22 +169,33 @@ class EmbeddingGenerator:
                 )
 
             logger.info(f"✓ Generated embedding successfully (dim={len(embedding)})")
+            if self.cache is not None:
+                self.cache.put_many(self.model, [text], [embedding])
             return embedding
 
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
 
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts in one API call.
+    def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        token_counts: Optional[List[int]] = None
+    ) -> List[List[float]]:
+        """Generate embeddings for multiple texts in as few API calls as possible.
 
         Batching is more efficient than individual calls:
         - Fewer API requests (faster)
         - Same cost per token
-        - Up to 2048 inputs per batch (OpenAI limit)
+        - Lists over OpenAI's per-request limits (2048 inputs, 300k tokens)
+          are split into several requests automatically
+        - Texts already in the local embedding cache are not sent at all,
+          and repeated texts are sent once
 
         Args:
             texts: List of input texts
+            token_counts: Token count of each text, if the caller already
+                has them (only used for logging; saves re-tokenizing)
 
         Returns:
             List of embedding vectors (one per input text)
@@ -162,25 +213,72 @@ class EmbeddingGenerator:
             logger.warning("Empty text list provided")
             return []
 
-        try:
-            # Count total tokens
-            total_tokens = sum(self.count_tokens(text) for text in texts)
-            total_cost = self.estimate_cost(total_tokens)
-
-            logger.info(
-                f"Generating {len(texts)} embeddings in batch "
-                f"({total_tokens} tokens, ${total_cost:.6f})"
+        # Embed each distinct text once
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            unique_counts = None
+            if token_counts is not None:
+                count_by_text = dict(zip(texts, token_counts))
+                unique_counts = [count_by_text[text] for text in unique_texts]
+            by_text = dict(zip(
+                unique_texts,
+                self.generate_embeddings_batch(unique_texts, unique_counts)
+            ))
+            return [by_text[text] for text in texts]
+
+        if self.cache is None:
+            return self._generate_embeddings_uncached(texts, token_counts)
+
+        # Only embed texts that aren't cached
+        embeddings = self.cache.get_many(self.model, texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if len(missing) < len(texts):
+            logger.info(f"Reusing {len(texts) - len(missing)} cached embedding(s)")
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            new_embeddings = self._generate_embeddings_uncached(
+                missing_texts,
+                [token_counts[i] for i in missing] if token_counts is not None else None
             )
+            self.cache.put_many(self.model, missing_texts, new_embeddings)
+            for i, embedding in zip(missing, new_embeddings):
+                embeddings[i] = embedding
 
-            # Call OpenAI API (single request for all texts)
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=texts,
-                encoding_format="float"
-            )
+        return embeddings
+
+    def _generate_embeddings_uncached(
+        self,
+        texts: List[str],
+        token_counts: Optional[List[int]] = None
+    ) -> List[List[float]]:
+        """generate_embeddings_batch() without the cache: always calls the API."""
+        try:
+            # Count total tokens
+            if token_counts is None:
+                token_counts = self.count_tokens_batch(texts)
+            if logger.isEnabledFor(logging.INFO):
+                total_tokens = sum(token_counts)
+                total_cost = self.estimate_cost(total_tokens)
+                logger.info(
+                    f"Generating {len(texts)} embeddings in batch "
+                    f"({total_tokens} tokens, ${total_cost:.6f})"
+                )
 
-            # Extract embeddings (order preserved)
-            embeddings = [item.embedding for item in response.data]
+            # One request per window that fits the API limits
+            embeddings = []
+            start = 0
+            while start < len(texts):
+                end, window_tokens = start, 0
+                while (
+                    end < len(texts)
+                    and end - start < MAX_REQUEST_INPUTS
+                    and (end == start or window_tokens + token_counts[end] <= MAX_REQUEST_TOKENS)
+                ):
+                    window_tokens += token_counts[end]
+                    end += 1
+                embeddings.extend(self._embed_request(texts[start:end]))
+                start = end
 
             # Validate
             if len(embeddings) != len(texts):
@@ -201,6 +299,27 @@ class EmbeddingGenerator:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
 
+    def _embed_request(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in a single API request (must fit the request limits)."""
+        if len(texts) > MAX_REQUEST_INPUTS:
+            raise ValueError(
+                f"{len(texts)} inputs exceed the {MAX_REQUEST_INPUTS}-input request limit"
+            )
+
+        # Packed float32 (base64) instead of a JSON array of numbers: ~4x
+        # less to download, and decoding skips parsing 1536 decimal strings.
+        # The raw response skips building a pydantic model per embedding.
+        response = self.client.embeddings.with_raw_response.create(
+            model=self.model,
+            input=texts,
+            encoding_format="base64"
+        )
+        data = response.http_response.json()["data"]
+
+        # Extract embeddings (in input order)
+        data.sort(key=lambda item: item["index"])
+        return [_decode_embedding(item["embedding"]) for item in data]
+
     def generate_with_metadata(self, text: str) -> Dict:
         """Generate embedding with metadata (token count, cost, etc.).
 
@@ -214,7 +333,7 @@ class EmbeddingGenerator:
         """
         token_count = self.count_tokens(text)
         cost = self.estimate_cost(token_count)
-        embedding = self.generate_embedding(text)
+        embedding = self.generate_embedding(text, token_count=token_count)
 
         return {
             "embedding": embedding,
@@ -224,6 +343,30 @@ class EmbeddingGenerator:
             "model": self.model
         }
 
+    def generate_batch_with_metadata(self, texts: List[str]) -> List[Dict]:
+        """Batch version of generate_with_metadata() (one API call for all texts).
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            List of dicts (one per text, in order) with keys: embedding,
+            token_count, cost_usd, dimensions, model
+        """
+        token_counts = self.count_tokens_batch(texts)
+        embeddings = self.generate_embeddings_batch(texts, token_counts=token_counts)
+
+        return [
+            {
+                "embedding": embedding,
+                "token_count": token_count,
+                "cost_usd": self.estimate_cost(token_count),
+                "dimensions": len(embedding),
+                "model": self.model
+            }
+            for embedding, token_count in zip(embeddings, token_counts)
+        ]
+
     def embed_document_with_chunking(
         self,
         text: str,
@@ -262,42 +405,130 @@ class EmbeddingGenerator:
             >>> len(result)  # Could be 1 (short) or multiple (long)
             3
         """
-        metadata = metadata or {}
+        results = self.embed_documents([
+            {"text": text, "doc_id": doc_id, "metadata": metadata}
+        ])[0]
+
+        total_tokens = sum(r['tokens'] for r in results)
+        total_cost = self.estimate_cost(total_tokens)
+
+        logger.info(
+            f"✓ Embedded document {doc_id}: {len(results)} chunk(s), "
+            f"{total_tokens} tokens, ${total_cost:.6f}"
+        )
 
-        # Step 1: Chunk the text (or keep as single chunk if short)
-        chunks = self.chunker.chunk_text(text, doc_id, metadata)
+        return results
 
-        # Step 2: Generate embeddings for all chunks
-        logger.info(f"Generating embeddings for {len(chunks)} chunk(s)...")
+    def embed_documents(
+        self,
+        documents: List[Dict],
+        batch_size: int = 96,
+        max_concurrent_requests: int = 4
+    ) -> List[List[Dict]]:
+        """Embed several documents, packing their chunks into shared requests.
 
-        # Collect all texts for batch embedding
-        chunk_texts = [chunk['text'] for chunk in chunks]
+        Chunks from all documents are sent together in batches of up to
+        batch_size inputs, so many short posts cost a few API calls instead
+        of one call each. Up to max_concurrent_requests batches are in
+        flight at once.
 
-        # Generate embeddings in batch (more efficient!)
-        embeddings = self.generate_embeddings_batch(chunk_texts)
+        Args:
+            documents: List of dicts with keys 'text', 'doc_id' and
+                optionally 'metadata' and 'token_count' (if already known)
+            batch_size: Maximum number of chunks per embeddings request
+            max_concurrent_requests: Maximum number of embeddings requests
+                sent in parallel
 
-        # Step 3: Combine embeddings with chunk metadata
-        results = []
-        for chunk, embedding in zip(chunks, embeddings):
-            results.append({
-                "chunk_id": chunk['chunk_id'],
-                "embedding": embedding,
-                "text": chunk['text'],
-                "tokens": chunk['tokens'],
-                "chunk_index": chunk['chunk_index'],
-                "total_chunks": chunk['total_chunks'],
-                "parent_id": chunk['parent_id'],
-                "metadata": chunk['metadata']
-            })
+        Returns:
+            One list per input document, in input order, containing chunk
+            dicts in the same format as embed_document_with_chunking()
 
-        total_tokens = sum(r['tokens'] for r in results)
-        total_cost = self.estimate_cost(total_tokens)
+        Example:
+            >>> results = generator.embed_documents([
+            ...     {"text": post_a, "doc_id": "blog:a"},
+            ...     {"text": post_b, "doc_id": "blog:b"},
+            ... ])
+            >>> len(results)
+            2
+        """
+        # Step 1: Chunk every document (or keep as single chunk if short)
+        doc_chunks = [
+            self.chunker.chunk_text(
+                doc['text'],
+                doc['doc_id'],
+                doc.get('metadata') or {},
+                token_count=doc.get('token_count')
+            )
+            for doc in documents
+        ]
+        all_chunks = [chunk for chunks in doc_chunks for chunk in chunks]
 
+        # Step 2: Generate embeddings for all chunks, batch_size at a time
         logger.info(
-            f"✓ Embedded document {doc_id}: {len(results)} chunk(s), "
-            f"{total_tokens} tokens, ${total_cost:.6f}"
+            f"Generating embeddings for {len(all_chunks)} chunk(s) "
+            f"from {len(documents)} document(s)..."
         )
 
+        texts = [c['text'] for c in all_chunks]
+        if self.cache is not None:
+            embeddings = self.cache.get_many(self.model, texts)
+        else:
+            embeddings = [None] * len(texts)
+
+        # Only embed chunks that aren't cached, and identical chunks once
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if len(missing) < len(texts):
+            logger.info(f"Reusing {len(texts) - len(missing)} cached embedding(s)")
+
+        first_index = {}
+        for i in missing:
+            first_index.setdefault(texts[i], i)
+        duplicates = [i for i in missing if first_index[texts[i]] != i]
+        missing = list(first_index.values())
+
+        def embed_batch(batch: List[int]) -> List[List[float]]:
+            batch_texts = [texts[i] for i in batch]
+            batch_embeddings = self._generate_embeddings_uncached(
+                batch_texts,
+                token_counts=[all_chunks[i]['tokens'] for i in batch]
+            )
+            if self.cache is not None:
+                self.cache.put_many(self.model, batch_texts, batch_embeddings)
+            return batch_embeddings
+
+        batches = [
+            missing[start:start + batch_size]
+            for start in range(0, len(missing), batch_size)
+        ]
+        if batches:
+            # Requests are network-bound, so overlap them
+            workers = min(max_concurrent_requests, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch, batch_embeddings in zip(batches, executor.map(embed_batch, batches)):
+                    for i, embedding in zip(batch, batch_embeddings):
+                        embeddings[i] = embedding
+
+        for i in duplicates:
+            embeddings[i] = embeddings[first_index[texts[i]]]
+
+        # Step 3: Combine embeddings with chunk metadata, split back per document
+        embeddings = iter(embeddings)
+        results = []
+        for chunks in doc_chunks:
+            results.append([
+                {
+                    "chunk_id": chunk['chunk_id'],
+                    "embedding": next(embeddings),
+                    "text": chunk['text'],
+                    "tokens": chunk['tokens'],
+                    "chunk_index": chunk['chunk_index'],
+                    "total_chunks": chunk['total_chunks'],
+                    "parent_id": chunk['parent_id'],
+                    "metadata": chunk['metadata']
+                }
+                for chunk in chunks
+            ])
+
         return results
 
 
@@ -0,0 +1,85 @@
+"""
+Local record of points known to exist in Qdrant, backed by SQLite.
+
+Lets existence checks (Layer 2 deduplication) answer for already-synced
+chunks without a network round trip. It is a write-through cache:
+RumiQdrantClient records points after upserting them and forgets them on
+delete, and only asks Qdrant about IDs the cache doesn't know.
+"""
+
+from typing import Iterable, List, Set
+import logging
+
+from src.storage.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+
+class PointCache:
+    """Persistent set of (namespace, point UUID) pairs.
+
+    A namespace identifies one collection on one server (e.g.
+    "localhost:6333/rumi_content"), so pointing the scripts at another
+    Qdrant server never reuses its entries.
+
+    Safe to share between threads.
+
+    Example:
+        >>> cache = PointCache(".cache/points.sqlite3")
+        >>> cache.add_many("localhost:6333/rumi_content", ["4d9c1e0a-..."])
+        >>> cache.contains_many("localhost:6333/rumi_content", ["4d9c1e0a-...", "0b1f..."])
+        {'4d9c1e0a-...'}
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+        """
+        self.path = path
+        self._store = SQLiteStore(
+            path,
+            "CREATE TABLE IF NOT EXISTS known_points ("
+            "namespace TEXT NOT NULL, uuid TEXT NOT NULL, "
+            "PRIMARY KEY (namespace, uuid))"
+        )
+
+        logger.info(f"PointCache opened at {path}")
+
+    def contains_many(self, namespace: str, uuids: List[str]) -> Set[str]:
+        """Return the subset of uuids recorded for a namespace."""
+        rows = self._store.query_in(
+            "SELECT uuid FROM known_points WHERE namespace = ? AND uuid IN ({placeholders})",
+            uuids,
+            (namespace,)
+        )
+        return {row[0] for row in rows}
+
+    def add_many(self, namespace: str, uuids: Iterable[str]):
+        """Record points as present in a namespace."""
+        self._store.write_many(
+            "INSERT OR IGNORE INTO known_points (namespace, uuid) VALUES (?, ?)",
+            [(namespace, u) for u in uuids]
+        )
+
+    def discard_many(self, namespace: str, uuids: Iterable[str]):
+        """Forget points (e.g. after deleting them)."""
+        self._store.write_many(
+            "DELETE FROM known_points WHERE namespace = ? AND uuid = ?",
+            [(namespace, u) for u in uuids]
+        )
+
+    def count(self, namespace: str) -> int:
+        """Number of points recorded for a namespace."""
+        return self._store.query(
+            "SELECT COUNT(*) FROM known_points WHERE namespace = ?", (namespace,)
+        )[0][0]
+
+    def clear(self, namespace: str):
+        """Forget every point of a namespace (e.g. after recreating it)."""
+        self._store.write("DELETE FROM known_points WHERE namespace = ?", (namespace,))
+
+    def close(self):
+        """Close the database connection."""
+        self._store.close()
@@ -10,7 +10,7 @@ This module provides:
 
 Deduplication Strategy:
 - Layer 1: upsert() with deterministic IDs prevents duplicates in Qdrant
-- Layer 2: point_exists() checks before embedding (saves OpenAI API calls)
+- Layer 2: point_exists() / points_exist() check before embedding (saves OpenAI API calls)
 - Layer 3: State manager (Task 1.1, future) tracks last sync timestamps
 """
 
@@ -21,21 +21,60 @@ from qdrant_client.models import (
     PointStruct,
     Filter,
     FieldCondition,
+    FilterSelector,
+    HnswConfigDiff,
     MatchValue,
     MatchAny,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    PayloadSelectorInclude,
+    PointIdsList,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    TextIndexParams,
+    TextIndexType,
+    TokenizerType,
 )
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Iterable, Optional, Sequence, Set, Tuple
+import hashlib
 import logging
+import time
 import uuid
 
+from src.storage.point_cache import PointCache
+
 logger = logging.getLogger(__name__)
 
+# Qdrant's default indexing_threshold (KB), restored after bulk loads
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+# How long get_collection_stats() results are reused (seconds)
+STATS_TTL_SECONDS = 5.0
 
+# Search the INT8 vectors, then rescore the top 2x candidates with the
+# original float32 vectors
+RESCORE_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
+
+@lru_cache(maxsize=1 << 17)
 def string_to_uuid(text: str) -> str:
     """Convert string to deterministic UUID.
 
     Same string always produces same UUID (UUID v5).
-    This enables upsert with string-like IDs.
+    This enables upsert with string-like IDs. Results are memoized, since
+    the same chunk_id is typically checked, upserted and logged in turn.
 
     Args:
         text: Input string (e.g., "blog:post_123:chunk_0")
@@ -53,6 +92,78 @@ def string_to_uuid(text: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, text))
 
 
+def string_to_uuids(texts: Iterable[str]) -> List[str]:
+    """Convert many strings to deterministic UUIDs (bulk string_to_uuid()).
+
+    Produces exactly the same UUIDs as string_to_uuid(), but hashes the
+    namespace once and reuses it instead of redoing it per string.
+
+    Args:
+        texts: Input strings
+
+    Returns:
+        UUID string for each input, in order
+    """
+    namespace_hash = hashlib.sha1(uuid.NAMESPACE_DNS.bytes)
+    uuids = []
+    for text in texts:
+        h = namespace_hash.copy()
+        h.update(text.encode("utf-8"))
+        digest = bytearray(h.digest()[:16])
+        digest[6] = (digest[6] & 0x0F) | 0x50  # Version 5
+        digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+        uuids.append(str(uuid.UUID(bytes=bytes(digest))))
+    return uuids
+
+
+def _as_float_list(vector: Sequence[float]) -> List[float]:
+    """Convert a vector to the plain list Qdrant's models accept.
+
+    Lists pass through; numpy and array.array vectors are converted with
+    one C-level tolist() instead of element by element.
+    """
+    if isinstance(vector, list):
+        return vector
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
+@lru_cache(maxsize=8)
+def _get_client(
+    host: str,
+    port: int,
+    grpc_port: int,
+    prefer_grpc: bool,
+    timeout: int
+) -> Tuple[QdrantClient, bool]:
+    """Get the process-wide QdrantClient for a server, creating it on first use.
+
+    RumiQdrantClient instances share it, so creating a wrapper per request
+    reuses the client's pooled (thread-safe) connections instead of
+    reconnecting. A gRPC client is probed once and replaced by a REST
+    client if the gRPC port is unreachable.
+
+    Returns:
+        (client, whether it uses gRPC)
+    """
+    client = QdrantClient(
+        host=host,
+        port=port,
+        grpc_port=grpc_port,
+        prefer_grpc=prefer_grpc,
+        timeout=timeout
+    )
+    if prefer_grpc:
+        try:
+            client.get_collections()
+        except Exception as e:
+            logger.warning(
+                f"gRPC port {grpc_port} unreachable ({e}), falling back to REST"
+            )
+            client.close()
+            return QdrantClient(host=host, port=port, timeout=timeout), False
+    return client, prefer_grpc
+
+
 class RumiQdrantClient:
     """Wrapper for Qdrant operations specific to Rumi.
 
@@ -73,36 +184,83 @@ class RumiQdrantClient:
         ... )
     """
 
-    def __init__(self, host: str = "localhost", port: int = 6333):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
+        timeout: int = 60,
+        point_cache_path: Optional[str] = None
+    ):
         """Initialize Qdrant client.
 
         Args:
             host: Qdrant server host (default: localhost)
             port: Qdrant server port (default: 6333)
+            grpc_port: Qdrant gRPC port (default: 6334)
+            prefer_grpc: Use gRPC instead of REST where possible, so vectors
+                are sent as packed floats instead of JSON (default: True).
+                The Qdrant container must publish grpc_port (docker run
+                -p 6333:6333 -p 6334:6334); if it is unreachable the client
+                falls back to REST.
+            timeout: Request timeout in seconds (default: 60)
+            point_cache_path: SQLite file recording points known to exist, so
+                existence checks skip Qdrant for already-synced chunks
+                (default: no local cache)
         """
-        self.client = QdrantClient(host=host, port=port)
+        # Shared with every other instance for the same server
+        self.client, prefer_grpc = _get_client(host, port, grpc_port, prefer_grpc, timeout)
+
         self.collection_name = "rumi_content"
         self.vector_size = 1536  # OpenAI text-embedding-3-small
 
-        logger.info(f"RumiQdrantClient initialized (host={host}, port={port})")
+        self.point_cache = PointCache(point_cache_path) if point_cache_path else None
+        # Cache entries belong to this server and collection only
+        self.point_cache_key = f"{host}:{port}/{self.collection_name}"
+        # Snapshot of every point ID, once load_point_ids() has run
+        self.point_ids: Optional[Set[str]] = None
+
+        # Set once the collection is known to exist, so repeated
+        # create_collection() calls skip the server round trips
+        self._collection_verified = False
+        # (fetched_at, stats) from the last get_collection_stats()
+        self._stats_cache: Optional[Tuple[float, Dict]] = None
+
+        logger.info(
+            f"RumiQdrantClient initialized (host={host}, port={port}, "
+            f"prefer_grpc={prefer_grpc})"
+        )
 
     def create_collection(self, recreate: bool = False):
         """Create the Rumi content collection.
 
+        Only the first call per instance checks the server (and ensures
+        the payload indexes); later calls return immediately unless
+        recreating.
+
         Args:
             recreate: If True, delete existing collection first (DANGER!)
         """
+        if self._collection_verified and not recreate:
+            return
+
         try:
-            # Check if collection exists
-            collections = self.client.get_collections()
-            exists = any(c.name == self.collection_name for c in collections.collections)
+            exists = self.client.collection_exists(self.collection_name)
 
             if exists:
                 if recreate:
                     logger.warning(f"Recreating collection: {self.collection_name}")
                     self.client.delete_collection(self.collection_name)
+                    if self.point_cache:
+                        self.point_cache.clear(self.point_cache_key)
+                    if self.point_ids is not None:
+                        self.point_ids = set()
+                    self._stats_cache = None
                 else:
                     logger.info(f"Collection {self.collection_name} already exists")
+                    self._create_payload_indexes()
+                    self._collection_verified = True
                     return
 
             # Create collection
@@ -110,15 +268,70 @@ class RumiQdrantClient:
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=self.vector_size,
-                    distance=Distance.COSINE  # Best for text embeddings
+                    distance=Distance.COSINE,  # Best for text embeddings
+                    on_disk=True  # float32 originals are only read to rescore
+                ),
+                # Payloads (full chunk text) stay on disk so RAM holds the
+                # quantized vectors and index; filtered fields are indexed
+                on_disk_payload=True,
+                hnsw_config=HnswConfigDiff(m=16, ef_construct=128),
+                # INT8 copies of the vectors kept in RAM (4x smaller); the
+                # original float32 vectors are used to rescore top results
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True
+                    )
                 )
             )
             logger.info(f"✓ Created collection: {self.collection_name}")
+            self._create_payload_indexes()
+            self._collection_verified = True
 
         except Exception as e:
             logger.error(f"Failed to create collection: {e}")
             raise
 
+    def _create_payload_indexes(self):
+        """Index payload fields that are filtered on directly.
+
+        - title: full-text (word tokens, lowercased), so the
+          get_blog_post_content tool can match titles without a vector search
+        - title_norm: keyword, for exact (normalized) title lookups
+        - published_ts: float range index, so the list_recent_posts tool can
+          scroll in date order (order_by requires one)
+        - category, source, tags: keyword, so search() filters use the index
+          instead of scanning every candidate's payload
+
+        Safe to call repeatedly; existing indexes are left as they are.
+        """
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name="title",
+            field_schema=TextIndexParams(
+                type=TextIndexType.TEXT,
+                tokenizer=TokenizerType.WORD,
+                lowercase=True
+            )
+        )
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name="title_norm",
+            field_schema=PayloadSchemaType.KEYWORD
+        )
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name="published_ts",
+            field_schema=PayloadSchemaType.FLOAT
+        )
+        for field_name in ("category", "source", "tags"):
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD
+            )
+
     def point_exists(self, chunk_id: str) -> bool:
         """Check if a document/chunk already exists in Qdrant.
 
@@ -140,24 +353,96 @@ class RumiQdrantClient:
             # Convert string ID to UUID
             point_uuid = string_to_uuid(chunk_id)
 
+            if self.point_ids is not None:
+                return point_uuid in self.point_ids
+
+            if self.point_cache and self.point_cache.contains_many(self.point_cache_key, [point_uuid]):
+                return True
+
             result = self.client.retrieve(
                 collection_name=self.collection_name,
                 ids=[point_uuid],
-                with_vectors=False  # Don't need vectors, just existence
+                with_payload=False,  # Don't need payload or vectors,
+                with_vectors=False   # just existence
             )
             exists = len(result) > 0
-            logger.debug(f"Point {chunk_id} (UUID: {point_uuid}) exists: {exists}")
+            if exists and self.point_cache:
+                self.point_cache.add_many(self.point_cache_key, [point_uuid])
+            logger.debug("Point %s (UUID: %s) exists: %s", chunk_id, point_uuid, exists)
             return exists
 
         except Exception as e:
             # If collection doesn't exist, point doesn't exist
-            logger.debug(f"Point existence check failed: {e}")
+            logger.debug("Point existence check failed: %s", e)
             return False
 
+    def points_exist(self, chunk_ids: List[str], batch_size: int = 1024) -> Set[str]:
+        """Check which of several documents/chunks already exist in Qdrant.
+
+        Batched Layer 2 deduplication: one retrieve call per batch_size IDs
+        instead of one point_exists() round trip each. With a point cache,
+        only IDs the cache doesn't know are sent to Qdrant; after
+        load_point_ids(), nothing is.
+
+        Args:
+            chunk_ids: Chunk identifiers (strings, converted to UUIDs)
+            batch_size: Maximum number of IDs per retrieve request
+
+        Returns:
+            The subset of chunk_ids that exist
+
+        Example:
+            >>> existing = client.points_exist(["blog:a:chunk_0", "blog:b:chunk_0"])
+            >>> "blog:a:chunk_0" in existing
+            True
+        """
+        if not chunk_ids:
+            return set()
+
+        try:
+            uuid_to_chunk_id = dict(zip(string_to_uuids(chunk_ids), chunk_ids))
+            uuids = list(uuid_to_chunk_id)
+
+            if self.point_ids is not None:
+                return {c for u, c in uuid_to_chunk_id.items() if u in self.point_ids}
+
+            cached = set()
+            if self.point_cache:
+                cached = self.point_cache.contains_many(self.point_cache_key, uuids)
+                uuids = [u for u in uuids if u not in cached]
+
+            # Bounded requests, so huge crawls don't build one giant call
+            found = []
+            for start in range(0, len(uuids), batch_size):
+                result = self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=uuids[start:start + batch_size],
+                    with_payload=False,
+                    with_vectors=False
+                )
+                found.extend(str(point.id) for point in result)
+
+            if found and self.point_cache:
+                self.point_cache.add_many(self.point_cache_key, found)
+
+            existing = {uuid_to_chunk_id[u] for u in cached}
+            existing.update(uuid_to_chunk_id[u] for u in found)
+
+            logger.debug(
+                "%d/%d points exist (%d from local cache)",
+                len(existing), len(chunk_ids), len(cached)
+            )
+            return existing
+
+        except Exception as e:
+            # If collection doesn't exist, points don't exist
+            logger.debug("Point existence check failed: %s", e)
+            return set()
+
     def upsert_document(
         self,
         chunk_id: str,
-        embedding: List[float],
+        embedding: Sequence[float],
         metadata: Dict
     ) -> bool:
         """Insert or update a document (Layer 1 deduplication).
@@ -168,7 +453,7 @@ class RumiQdrantClient:
 
         Args:
             chunk_id: Unique identifier (e.g., "blog:post_123:chunk_0")
-            embedding: Vector embedding (1536 dimensions)
+            embedding: Vector embedding (1536 dimensions; list or numpy array)
             metadata: Document metadata (title, category, tags, content, etc.)
 
         Returns:
@@ -187,57 +472,196 @@ class RumiQdrantClient:
             ... )
         """
         try:
-            # Validate embedding dimensions
-            if len(embedding) != self.vector_size:
-                raise ValueError(
-                    f"Expected {self.vector_size} dimensions, got {len(embedding)}"
-                )
-
-            # Convert string ID to UUID (Qdrant requirement)
-            point_uuid = string_to_uuid(chunk_id)
-
-            # Store original chunk_id in metadata for reference
-            payload = metadata.copy()
-            payload["chunk_id"] = chunk_id
-
-            # Create point
-            point = PointStruct(
-                id=point_uuid,  # UUID for Qdrant
-                vector=embedding,
-                payload=payload
-            )
+            point = self._build_point(chunk_id, embedding, metadata)
 
             # UPSERT (not insert!) - prevents duplicates
             self.client.upsert(
                 collection_name=self.collection_name,
                 points=[point]
             )
+            self._remember_points([point.id])
 
-            logger.info(f"✓ Upserted document: {chunk_id} (UUID: {point_uuid})")
+            # Per-point detail only at DEBUG; batch callers use upsert_documents()
+            logger.debug("✓ Upserted document: %s (UUID: %s)", chunk_id, point.id)
             return True
 
         except Exception as e:
             logger.error(f"Failed to upsert document {chunk_id}: {e}")
             return False
 
+    def upsert_documents(
+        self,
+        chunks: List[Dict],
+        batch_size: int = 64,
+        wait: bool = True,
+        max_concurrent_requests: int = 2
+    ) -> List[str]:
+        """Insert or update many documents, batch_size points per request.
+
+        Same semantics as upsert_document() (Layer 1 deduplication), but
+        one round trip per batch instead of one per chunk, with up to
+        max_concurrent_requests batches in flight at once.
+
+        Args:
+            chunks: List of dicts with keys 'chunk_id', 'embedding' and
+                'metadata' (e.g. the output of embed_document_with_chunking)
+            batch_size: Maximum number of points per upsert request
+            wait: Wait until each batch is applied. With False the server
+                acknowledges as soon as the batch is queued (faster, but
+                points may not be searchable or counted immediately, only
+                failures to queue are reported, and the points aren't
+                recorded in the local point cache)
+            max_concurrent_requests: Maximum number of upsert requests sent
+                in parallel (Qdrant gains little beyond 2)
+
+        Returns:
+            chunk_ids that failed to upsert (empty if all succeeded)
+
+        Example:
+            >>> chunks = generator.embed_document_with_chunking(text, "blog:post_123")
+            >>> failed = client.upsert_documents(chunks)
+        """
+        def upsert_batch(batch: List[Dict]) -> List[str]:
+            try:
+                point_ids = string_to_uuids(c['chunk_id'] for c in batch)
+                points = [
+                    self._build_point(c['chunk_id'], c['embedding'], c['metadata'], point_id)
+                    for c, point_id in zip(batch, point_ids)
+                ]
+
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                    wait=wait
+                )
+                if wait:
+                    self._remember_points([p.id for p in points])
+                else:
+                    # Only queued: don't record points Qdrant hasn't applied
+                    self._stats_cache = None
+
+                logger.info("✓ Upserted %d documents", len(points))
+                return []
+
+            except Exception as e:
+                logger.error(f"Failed to upsert batch of {len(batch)} documents: {e}")
+                return [c['chunk_id'] for c in batch]
+
+        batches = [
+            chunks[start:start + batch_size]
+            for start in range(0, len(chunks), batch_size)
+        ]
+        if len(batches) <= 1 or max_concurrent_requests <= 1:
+            return [chunk_id for batch in batches for chunk_id in upsert_batch(batch)]
+
+        workers = min(max_concurrent_requests, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [
+                chunk_id
+                for failed in executor.map(upsert_batch, batches)
+                for chunk_id in failed
+            ]
+
+    def bulk_load(
+        self,
+        chunks: Iterable[Dict],
+        batch_size: int = 512,
+        parallel: int = 2
+    ):
+        """Load many documents at once, for initial or full re-ingestion.
+
+        Uses Qdrant's upload_points(), which streams batches from several
+        worker processes (with retries) instead of one request at a time.
+        Point IDs are derived from chunk_id as in upsert_document(), so
+        re-running a load overwrites rather than duplicates points.
+        Combine with bulk_load_context() for large loads.
+
+        Args:
+            chunks: Dicts with keys 'chunk_id', 'embedding' and 'metadata'
+                (may be a generator; consumed once)
+            batch_size: Points per upload request
+            parallel: Number of upload processes (default: 2; raise it for
+                very large loads on a machine with cores to spare)
+
+        Raises:
+            Exception: If a batch still fails after retries
+
+        Example:
+            >>> with client.bulk_load_context():
+            ...     client.bulk_load(chunks)
+        """
+        point_ids = []
+
+        def points():
+            for c in chunks:
+                point = self._build_point(c['chunk_id'], c['embedding'], c['metadata'])
+                point_ids.append(point.id)
+                yield point
+
+        self.client.upload_points(
+            collection_name=self.collection_name,
+            points=points(),
+            batch_size=batch_size,
+            parallel=parallel,
+            wait=True
+        )
+        # upload_points raises if any batch fails, so all of them are stored
+        self._remember_points(point_ids)
+        logger.info(f"✓ Bulk-loaded {len(point_ids)} documents ({parallel} process(es))")
+
+    def _build_point(
+        self,
+        chunk_id: str,
+        embedding: Sequence[float],
+        metadata: Dict,
+        point_id: Optional[str] = None
+    ) -> PointStruct:
+        """Validate a document and convert it to a Qdrant point.
+
+        Args:
+            chunk_id: Unique identifier (converted to a UUID point ID)
+            embedding: Vector embedding (1536 dimensions); a list, or any
+                1-D float sequence such as a numpy or array.array vector
+            metadata: Document metadata (stored as payload; not modified)
+            point_id: string_to_uuid(chunk_id), if the caller already has it
+
+        Returns:
+            PointStruct with the original chunk_id stored in the payload
+        """
+        # Validate embedding dimensions
+        if len(embedding) != self.vector_size:
+            raise ValueError(
+                f"Expected {self.vector_size} dimensions, got {len(embedding)}"
+            )
+
+        return PointStruct(
+            id=point_id or string_to_uuid(chunk_id),  # UUID for Qdrant
+            vector=_as_float_list(embedding),
+            # Original chunk_id stored alongside the metadata for reference
+            payload={**metadata, "chunk_id": chunk_id}
+        )
+
     def search(
         self,
-        query_vector: List[float],
+        query_vector: Sequence[float],
         limit: int = 10,
         category: Optional[str] = None,
         source: Optional[str] = None,
         tags: Optional[List[str]] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        payload_fields: Optional[List[str]] = None
     ) -> List[Dict]:
         """Search for similar documents with optional filters.
 
         Args:
-            query_vector: Query embedding vector (1536 dims)
+            query_vector: Query embedding vector (1536 dims; list or numpy array)
             limit: Maximum number of results
             category: Filter by category ("work" or "personal")
             source: Filter by source ("blog", "linkedin", "twitter", "fathom")
             tags: Filter by tags (matches if ANY tag matches)
             score_threshold: Minimum similarity score (0-1)
+            payload_fields: Payload fields to return (e.g. ["title", "url"]);
+                None returns the whole payload, including full content
 
         Returns:
             List of dicts with keys:
@@ -256,59 +680,21 @@ class RumiQdrantClient:
             ...     print(f"{result['metadata']['title']} (score: {result['score']})")
         """
         try:
-            # Build filters
-            filter_conditions = []
-
-            if category:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value=category)
-                    )
-                )
-
-            if source:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="source",
-                        match=MatchValue(value=source)
-                    )
-                )
-
-            if tags:
-                # Match if ANY of the provided tags match
-                filter_conditions.append(
-                    FieldCondition(
-                        key="tags",
-                        match=MatchAny(any=tags)
-                    )
-                )
-
-            query_filter = Filter(must=filter_conditions) if filter_conditions else None
-
-            # Search (using updated API)
             results = self.client.query_points(
                 collection_name=self.collection_name,
-                query=query_vector,
-                query_filter=query_filter,
+                query=_as_float_list(query_vector),
+                query_filter=self._build_filter(category, source, tuple(tags or ())),
                 limit=limit,
                 score_threshold=score_threshold,
-                with_payload=True
+                with_payload=self._payload_selector(payload_fields),
+                search_params=RESCORE_SEARCH_PARAMS
             ).points
 
-            # Format results
-            formatted_results = [
-                {
-                    "chunk_id": hit.id,
-                    "score": hit.score,
-                    "metadata": hit.payload
-                }
-                for hit in results
-            ]
+            formatted_results = self._format_hits(results)
 
             logger.info(
-                f"✓ Search found {len(formatted_results)} results "
-                f"(category={category}, source={source}, tags={tags})"
+                "✓ Search found %d results (category=%s, source=%s, tags=%s)",
+                len(formatted_results), category, source, tags
             )
 
             return formatted_results
@@ -317,6 +703,121 @@ class RumiQdrantClient:
             logger.error(f"Search failed: {e}")
             return []
 
+    def search_batch(self, queries: List[Dict]) -> List[List[Dict]]:
+        """Run several searches in a single request.
+
+        For multi-query retrieval (query rewriting, HyDE, ...): one
+        round trip for all queries instead of one search() call each.
+
+        Args:
+            queries: Dicts with key 'query_vector' and optionally 'limit'
+                (default 10), 'category', 'source', 'tags',
+                'score_threshold' and 'payload_fields', as for search()
+
+        Returns:
+            One result list per query, in order, each shaped like search()'s
+            (all empty if the request fails)
+
+        Example:
+            >>> results = client.search_batch([
+            ...     {"query_vector": embedding_a, "limit": 5},
+            ...     {"query_vector": embedding_b, "category": "work"}
+            ... ])
+        """
+        if not queries:
+            return []
+
+        try:
+            requests = [
+                QueryRequest(
+                    query=_as_float_list(q["query_vector"]),
+                    filter=self._build_filter(
+                        q.get("category"), q.get("source"), tuple(q.get("tags") or ())
+                    ),
+                    limit=q.get("limit", 10),
+                    score_threshold=q.get("score_threshold"),
+                    with_payload=self._payload_selector(q.get("payload_fields")),
+                    params=RESCORE_SEARCH_PARAMS
+                )
+                for q in queries
+            ]
+
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+
+            results = [self._format_hits(response.points) for response in responses]
+            logger.info(
+                f"✓ Batch search of {len(queries)} queries found "
+                f"{sum(len(r) for r in results)} results"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_filter(
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        tags: Tuple[str, ...] = ()
+    ) -> Optional[Filter]:
+        """Build the payload filter for a search (None if unfiltered).
+
+        Cached, so repeated searches with the same filters reuse one Filter
+        object. Callers must not modify the returned filter.
+        """
+        filter_conditions = []
+
+        if category:
+            filter_conditions.append(
+                FieldCondition(
+                    key="category",
+                    match=MatchValue(value=category)
+                )
+            )
+
+        if source:
+            filter_conditions.append(
+                FieldCondition(
+                    key="source",
+                    match=MatchValue(value=source)
+                )
+            )
+
+        if tags:
+            # Match if ANY of the provided tags match
+            filter_conditions.append(
+                FieldCondition(
+                    key="tags",
+                    match=MatchAny(any=list(tags))
+                )
+            )
+
+        return Filter(must=filter_conditions) if filter_conditions else None
+
+    @staticmethod
+    def _payload_selector(payload_fields: Optional[List[str]]):
+        """with_payload value for a search: everything, or only some fields."""
+        if payload_fields is None:
+            return True
+        return PayloadSelectorInclude(include=payload_fields)
+
+    @staticmethod
+    def _format_hits(hits) -> List[Dict]:
+        """Convert scored points to search() result dicts."""
+        return [
+            {
+                "chunk_id": hit.id,
+                "score": hit.score,
+                "metadata": hit.payload
+            }
+            for hit in hits
+        ]
+
     def delete_document(self, chunk_id: str) -> bool:
         """Delete a document by ID.
 
@@ -334,6 +835,7 @@ class RumiQdrantClient:
                 collection_name=self.collection_name,
                 points_selector=[point_uuid]
             )
+            self._forget_points([point_uuid])
             logger.info(f"✓ Deleted document: {chunk_id} (UUID: {point_uuid})")
             return True
 
@@ -341,24 +843,238 @@ class RumiQdrantClient:
             logger.error(f"Failed to delete document {chunk_id}: {e}")
             return False
 
-    def get_collection_stats(self) -> Dict:
+    def delete_documents(self, chunk_ids: List[str]) -> bool:
+        """Delete several documents in one request.
+
+        Args:
+            chunk_ids: Document identifiers to delete (converted to UUIDs)
+
+        Returns:
+            True if successful
+        """
+        if not chunk_ids:
+            return True
+
+        try:
+            point_uuids = string_to_uuids(chunk_ids)
+
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=PointIdsList(points=point_uuids)
+            )
+            self._forget_points(point_uuids)
+            logger.info(f"✓ Deleted {len(point_uuids)} documents")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete {len(chunk_ids)} documents: {e}")
+            return False
+
+    def delete_by_filter(
+        self,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """Delete every document matching the filters, server-side.
+
+        Filters work as in search(). Since the deleted IDs aren't returned,
+        the local point cache is cleared and the load_point_ids() snapshot
+        dropped afterwards.
+
+        Args:
+            category: Delete documents in this category
+            source: Delete documents from this source (e.g. "blog")
+            tags: Delete documents with ANY of these tags
+
+        Returns:
+            True if successful
+
+        Raises:
+            ValueError: If no filter is given (use create_collection(recreate=True)
+                to empty the collection)
+
+        Example:
+            >>> client.delete_by_filter(source="linkedin")
+        """
+        query_filter = self._build_filter(category, source, tuple(tags or ()))
+        if query_filter is None:
+            raise ValueError("delete_by_filter() needs at least one filter")
+
+        try:
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(filter=query_filter)
+            )
+            self.point_ids = None
+            self._stats_cache = None
+            if self.point_cache:
+                self.point_cache.clear(self.point_cache_key)
+            logger.info(
+                f"✓ Deleted documents (category={category}, source={source}, tags={tags})"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete documents by filter: {e}")
+            return False
+
+    @contextmanager
+    def bulk_load_context(self):
+        """Pause HNSW indexing while bulk-loading documents.
+
+        Sets the collection's indexing_threshold to 0 so the optimizer
+        doesn't keep rebuilding the index while points are streaming in,
+        then restores the original threshold on exit, which triggers a
+        single indexing pass. Searches are slower (unindexed segments are
+        scanned) until that pass completes.
+
+        Example:
+            >>> with client.bulk_load_context():
+            ...     client.upsert_documents(chunks)
+        """
+        info = self.client.get_collection(self.collection_name)
+        original_threshold = info.config.optimizer_config.indexing_threshold
+
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
+        )
+        logger.info("Paused indexing for bulk load")
+
+        try:
+            yield
+        finally:
+            self.client.update_collection(
+                collection_name=self.collection_name,
+                optimizers_config=OptimizersConfigDiff(
+                    indexing_threshold=original_threshold
+                    if original_threshold is not None else DEFAULT_INDEXING_THRESHOLD
+                )
+            )
+            logger.info("Resumed indexing after bulk load")
+
+    def get_collection_stats(self, max_age: float = STATS_TTL_SECONDS) -> Dict:
         """Get collection statistics.
 
+        Results are reused for max_age seconds, so dashboards that poll
+        don't hit the server on every refresh. Writes through this client
+        discard the cached result.
+
+        Args:
+            max_age: Maximum age in seconds of a cached result (0 to always fetch)
+
         Returns:
             Dict with keys: points_count, vectors_count, status
         """
+        stats_cache = self._stats_cache
+        if stats_cache and time.monotonic() - stats_cache[0] < max_age:
+            return dict(stats_cache[1])
+
         try:
             collection_info = self.client.get_collection(self.collection_name)
-            return {
+            stats = {
                 "points_count": collection_info.points_count,
                 "vectors_count": collection_info.vectors_count,
                 "status": collection_info.status,
                 "optimizer_status": collection_info.optimizer_status
             }
+            self._stats_cache = (time.monotonic(), stats)
+            return dict(stats)
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
             return {}
 
+    def count_points(self) -> int:
+        """Count the points in the collection.
+
+        Cheaper than get_collection_stats() when only the count is needed:
+        the server returns a single integer instead of the collection info.
+
+        Returns:
+            Exact number of points (0 if the count fails)
+        """
+        try:
+            return self.client.count(
+                collection_name=self.collection_name,
+                exact=True
+            ).count
+        except Exception as e:
+            logger.error(f"Failed to count points: {e}")
+            return 0
+
+    def load_point_ids(self) -> int:
+        """Load every point ID into memory for local existence checks.
+
+        One scroll over the collection (IDs only); afterwards
+        point_exists() and points_exist() answer from memory without any
+        request. Upserts and deletes through this client keep the
+        snapshot current; points written by other processes afterwards
+        are not seen (they are simply re-upserted, which is idempotent).
+
+        Returns:
+            Number of point IDs loaded
+        """
+        point_ids = set()
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=10_000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            point_ids.update(str(point.id) for point in points)
+            if offset is None:
+                break
+
+        self.point_ids = point_ids
+        logger.info(f"Loaded {len(point_ids)} point IDs from {self.collection_name}")
+        return len(point_ids)
+
+    def _remember_points(self, point_uuids: List[str]):
+        """Record points as present after a successful upsert."""
+        self._stats_cache = None
+        if self.point_ids is not None:
+            self.point_ids.update(point_uuids)
+        if self.point_cache:
+            self.point_cache.add_many(self.point_cache_key, point_uuids)
+
+    def _forget_points(self, point_uuids: List[str]):
+        """Record points as gone after a successful delete."""
+        self._stats_cache = None
+        if self.point_ids is not None:
+            self.point_ids.difference_update(point_uuids)
+        if self.point_cache:
+            self.point_cache.discard_many(self.point_cache_key, point_uuids)
+
+    def verify_point_cache(self) -> bool:
+        """Check the local point cache against the collection.
+
+        The cache only ever lists points this client wrote, read or
+        deleted, so it can never hold more points than the collection.
+        If it does (the collection was rebuilt or pruned elsewhere), it
+        is cleared and refilled by later existence checks.
+
+        Returns:
+            True if the cache was consistent (or there is no cache)
+        """
+        if not self.point_cache:
+            return True
+
+        cached = self.point_cache.count(self.point_cache_key)
+        actual = self.count_points()
+        if cached <= actual:
+            return True
+
+        logger.warning(
+            f"Point cache lists {cached} points but {self.collection_name} "
+            f"has {actual}, clearing it"
+        )
+        self.point_cache.clear(self.point_cache_key)
+        return False
+
 
 def test_qdrant_client():
     """Test the Qdrant client with deduplication."""
@@ -397,8 +1113,7 @@ def test_qdrant_client():
 
     # Check stats
     print("\n4. Collection stats:")
-    stats = client.get_collection_stats()
-    print(f"   Points count: {stats.get('points_count')}")
+    print(f"   Points count: {client.count_points()}")
     print(f"   (Should be 1, not 2! Upsert works!)")
 
     # Test search
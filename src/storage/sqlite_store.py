@@ -0,0 +1,88 @@
+"""
+Thread-safe SQLite connection shared by the local caches.
+
+EmbeddingCache, ClassificationCache and PointCache each keep a small
+keyed table in a local SQLite file; this class owns the connection, the
+lock and the table setup so they only contain their queries.
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Sequence
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Keys per "IN (...)" query, well under SQLite's bound-parameter limit
+IN_BATCH_SIZE = 500
+
+
+class SQLiteStore:
+    """One SQLite connection, guarded by a lock so threads can share it.
+
+    Example:
+        >>> store = SQLiteStore(".cache/x.sqlite3",
+        ...                     "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT)")
+        >>> store.write("INSERT OR REPLACE INTO kv VALUES (?, ?)", ("a", "1"))
+        >>> store.query("SELECT v FROM kv WHERE k = ?", ("a",))
+        [('1',)]
+    """
+
+    def __init__(self, path: str, schema: str):
+        """Open (or create) the database and its table.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            schema: CREATE TABLE IF NOT EXISTS statement for the table
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(schema)
+        self._conn.commit()
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        """Run a SELECT and return all rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query_in(self, sql: str, keys: Sequence, params: Sequence = ()) -> List[tuple]:
+        """Run a SELECT with an "IN ({placeholders})" clause over many keys.
+
+        Args:
+            sql: Query containing "{placeholders}" where the key list goes
+            keys: Values for the IN clause (queried IN_BATCH_SIZE at a time)
+            params: Parameters bound before the keys
+
+        Returns:
+            Rows from all batches
+        """
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), IN_BATCH_SIZE):
+                batch = list(keys[start:start + IN_BATCH_SIZE])
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(self._conn.execute(
+                    sql.format(placeholders=placeholders), [*params, *batch]
+                ))
+        return rows
+
+    def write(self, sql: str, params: Sequence = ()):
+        """Run one statement and commit."""
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def write_many(self, sql: str, rows: Iterable[Sequence]):
+        """Run one statement per row and commit once."""
+        with self._lock:
+            self._conn.executemany(sql, rows)
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()